@@ -0,0 +1,138 @@
+"""
+World bounding box of many objects, as computed by the drop2floor / dropOnSurface scripts.
+
+Run with: python __benchmark__/bench_bounding_box.py --blender /path/to/blender [--counts 100,1000,10000]
+Modes:
+    legacy      a python loop over the 8 mathutils corners of each object, recomputed by each getter
+    vectorized  ObjectsBoundingBox, all corners in one numpy array, computed once
+"""
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ADDON_DIR = Path(__file__).parent.parent
+
+
+class LegacyObjectsBoundingBox():
+    """ObjectsBoundingBox before vectorizing"""
+
+    def __init__(self, obj_list):
+        self.obj_list = obj_list
+        self._bbox_pts = self.get_bbox_pts()
+        self.bvh_tree_update()
+
+    def _calc_bbox_pts(self):
+        from mathutils import Vector
+        obj = self.obj_list[0]
+        bbox_pts = obj.get_bbox_pts(is_local=False)
+
+        max_x = max(bbox_pts, key=lambda v: v.x).x
+        max_y = max(bbox_pts, key=lambda v: v.y).y
+        max_z = max(bbox_pts, key=lambda v: v.z).z
+
+        min_x = min(bbox_pts, key=lambda v: v.x).x
+        min_y = min(bbox_pts, key=lambda v: v.y).y
+        min_z = min(bbox_pts, key=lambda v: v.z).z
+
+        for obj in self.obj_list:
+            bbox_pts = obj.get_bbox_pts(is_local=False)
+
+            max_x = max(max_x, max(bbox_pts, key=lambda v: v.x).x)
+            max_y = max(max_y, max(bbox_pts, key=lambda v: v.y).y)
+            max_z = max(max_z, max(bbox_pts, key=lambda v: v.z).z)
+
+            min_x = min(min_x, min(bbox_pts, key=lambda v: v.x).x)
+            min_y = min(min_y, min(bbox_pts, key=lambda v: v.y).y)
+            min_z = min(min_z, min(bbox_pts, key=lambda v: v.z).z)
+
+        self.min_x, self.min_y, self.min_z = min_x, min_y, min_z
+        self.max_x, self.max_y, self.max_z = max_x, max_y, max_z
+
+        x = self.min_x, self.max_x
+        y = self.min_y, self.max_y
+        z = self.min_z, self.max_z
+        return [Vector((x[i], y[j], z[k])) for i in range(2) for j in range(2) for k in range(2)]
+
+    def get_bbox_pts(self):
+        return self._calc_bbox_pts()
+
+    def get_bbox_center(self):
+        from mathutils import Vector
+        total = Vector((0, 0, 0))
+        for v in self.get_bbox_pts():
+            total = total + v
+        return total / 8
+
+    def get_bottom_center(self):
+        pt = self.get_bbox_center()
+        pt.z -= (self.max_z - self.min_z) / 2
+        return pt
+
+    def bvh_tree_update(self):
+        from mathutils.bvhtree import BVHTree
+        from cdi_tool.boundingBox import faces
+        self._bvh_tree = BVHTree.FromPolygons(self.get_bbox_pts(), faces)
+
+
+def make_objects(count: int):
+    import bpy
+    from mathutils import Euler, Matrix, Vector
+
+    rng = random.Random(0)
+    mesh = bpy.data.meshes.new('cdi_bench')
+    mesh.from_pydata([(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], [], [])
+    objs = []
+    for i in range(count):
+        obj = bpy.data.objects.new(f'cdi_bench_{i}', mesh)
+        location = Vector([rng.uniform(-100, 100) for _ in range(3)])
+        rotation = Euler([rng.uniform(0, 3.14) for _ in range(3)])
+        obj.matrix_world = Matrix.LocRotScale(location, rotation, Vector([rng.uniform(0.5, 2) for _ in range(3)]))
+        objs.append(obj)
+    return objs
+
+
+def run_in_blender(counts: list[int]):
+    """executed inside blender"""
+    sys.path.insert(0, str(ADDON_DIR / 'modules'))
+    from cdi_tool.boundingBox import ObjectBoundingBox, ObjectsBoundingBox
+
+    for count in counts:
+        objs = make_objects(count)
+        bboxs = [ObjectBoundingBox(obj, mode='FAST', is_local=False) for obj in objs]
+        results = {}
+        for mode, cls in (('legacy', LegacyObjectsBoundingBox), ('vectorized', ObjectsBoundingBox)):
+            start = time.perf_counter()
+            objs_A = cls(bboxs)
+            bottom = objs_A.get_bottom_center()
+            objs_A.get_bbox_center()
+            elapsed = time.perf_counter() - start
+            results[mode] = bottom
+            print(f'CDI_BENCH objects={count:<6} {mode:<10} {elapsed * 1000:9.1f} ms', flush=True)
+        assert (results['legacy'] - results['vectorized']).length < 1e-4, results
+
+        import bpy
+        mesh = objs[0].data
+        for obj in objs:
+            bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+
+
+def main():
+    argv = sys.argv[1:]
+    blender = argv[argv.index('--blender') + 1] if '--blender' in argv else 'blender'
+    counts = argv[argv.index('--counts') + 1] if '--counts' in argv else '100,1000,10000'
+
+    cmd = [blender, '-b', '--factory-startup', '--python', __file__, '--', '--counts', counts]
+    result = subprocess.run(cmd, capture_output=True, text=True, errors='replace')
+    lines = [line for line in result.stdout.splitlines() if line.startswith('CDI_BENCH')]
+    print('\n'.join(lines) if lines else f'failed\n{result.stdout[-2000:]}\n{result.stderr[-2000:]}')
+
+
+if __name__ == '__main__':
+    if '--' in sys.argv:
+        _argv = sys.argv[sys.argv.index('--') + 1:]
+        run_in_blender([int(c) for c in _argv[_argv.index('--counts') + 1].split(',')])
+    else:
+        main()
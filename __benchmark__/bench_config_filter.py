@@ -0,0 +1,91 @@
+"""
+Config list filtering with 5,000 items in 20 categories, per redraw.
+Run with: python __benchmark__/bench_config_filter.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config_filter import ConfigFilter
+
+ITEMS = 5000
+CATEGORIES = 20
+BITFLAG = 1 << 30
+SCRIPTS_TYPES = ('pre_script', 'post_script', 'foreach_pre_script', 'foreach_post_script')
+
+
+class Item():
+    """what the list reads from a CDI_ConfigItem"""
+
+    def __init__(self, i: int, rng: random.Random):
+        self.name = f'Importer {i:05d} {rng.choice(["obj", "fbx", "usd", "png"])}'
+        self.category = f'category_{rng.randrange(CATEGORIES):02d}'
+        self.bl_file_extensions = rng.choice(['.obj;.OBJ', '.fbx', '.usd;.usda;.usdc', '.png;.jpg'])
+        self.bl_import_operator = rng.choice(['wm.obj_import', 'import_scene.fbx', 'wm.usd_import', 'image.open'])
+        self.pre_script = self.post_script = self.foreach_pre_script = ''
+        self.foreach_post_script = rng.choice(['', 'drop2floor.py'])
+
+
+def sort_items_helper(sort_data, key, reverse=False):
+    """UI_UL_list.sort_items_helper"""
+    sort_data.sort(key=key, reverse=reverse)
+    neworder = [None] * len(sort_data)
+    for newidx, (orgidx, *_) in enumerate(sort_data):
+        neworder[orgidx] = newidx
+    return neworder
+
+
+def legacy_filter(items: list[Item], category: str) -> list[int]:
+    """linear scan of every item on every redraw, plus the script check of draw_item"""
+    filtered = [BITFLAG] * len(items)
+    for i, item in enumerate(items):
+        if item.category != category:
+            filtered[i] &= ~BITFLAG
+    for item in items:
+        any(getattr(item, st) != '' for st in SCRIPTS_TYPES)
+    return filtered
+
+
+def rows(items: list[Item]):
+    return ((item.category, item.name, item.bl_file_extensions, item.bl_import_operator,
+             any(getattr(item, st) for st in SCRIPTS_TYPES)) for item in items)
+
+
+def timed(name: str, func, repeat: int = 20):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f'{name:<32} {best * 1000:8.3f} ms')
+
+
+def main():
+    rng = random.Random(0)
+    items = [Item(i, rng) for i in range(ITEMS)]
+    config_filter = ConfigFilter()
+
+    timed('legacy redraw', lambda: legacy_filter(items, 'category_03'))
+    timed('rebuild after an edit', lambda: config_filter.rebuild(rows(items)))
+    timed('redraw, category', lambda: config_filter.filter('category_03', '', BITFLAG))
+
+    def search():
+        config_filter._flags.clear()
+        config_filter.filter('category_03', 'FBX', BITFLAG)
+
+    timed('new search, category + text', search)
+    config_filter._order = None
+    timed('sort by name (first)', lambda: config_filter.order(sort_items_helper), repeat=1)
+    timed('sort by name (cached)', lambda: config_filter.order(sort_items_helper))
+
+    legacy = legacy_filter(items, 'category_03')
+    assert legacy == config_filter.filter('category_03', '', BITFLAG)
+    print(f'{sum(1 for f in legacy if f)} items shown in category_03, '
+          f'{sum(1 for f in config_filter.filter("category_03", "fbx", BITFLAG) if f)} match "fbx"')
+
+
+if __name__ == '__main__':
+    main()
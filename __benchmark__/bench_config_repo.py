@@ -0,0 +1,90 @@
+"""
+Startup config parsing with 1,000 synthetic configs across 50 category files.
+Run with: python __benchmark__/bench_config_repo.py
+"""
+import importlib
+import json
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+ADDON_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ADDON_DIR.parent))
+# the addon package without running its __init__, which needs bpy
+_package = types.ModuleType(ADDON_DIR.name)
+_package.__path__ = [str(ADDON_DIR)]
+sys.modules[ADDON_DIR.name] = _package
+
+ConfigRepository = importlib.import_module(f'{ADDON_DIR.name}.config_repo').ConfigRepository
+
+CATEGORIES = 50
+CONFIGS = 1000
+
+
+def write_configs(directory: Path):
+    per_file = CONFIGS // CATEGORIES
+    for c in range(CATEGORIES):
+        data = {}
+        for i in range(per_file):
+            data[f'Importer {c}-{i}'] = {
+                'bl_import_operator': 'wm.obj_import',
+                'bl_file_extensions': '.obj;.OBJ',
+                'poll_area': 'VIEW_3D',
+                'operator_context': 'EXEC_DEFAULT',
+                'foreach_post_script': 'alignAxisX.py;drop2floor.py',
+            }
+        with open(directory / f'category_{c:02d}.json', 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
+
+
+def legacy_startup(directory: Path):
+    """before the config repository: registration and the config list both parse every file"""
+    datas = {}
+    for file in directory.iterdir():
+        with open(file, 'r', encoding='utf-8') as f:
+            datas.update(json.load(f))
+    cat_datas = {}
+    for file in directory.iterdir():
+        with open(file, 'r', encoding='utf-8') as f:
+            cat_datas[file.stem] = json.load(f)
+    return datas, cat_datas
+
+
+def repo_startup(repo: ConfigRepository):
+    return repo.merged(), repo.categories()
+
+
+def timeit(name: str, func, repeat: int = 20):
+    best = min(_once(func) for _ in range(repeat))
+    print(f'{name:<36} {best * 1000:8.2f} ms')
+
+
+def _once(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory(prefix='cdi_bench_') as tmp:
+        directory = Path(tmp, 'config')
+        directory.mkdir()
+        write_configs(directory)
+        snapshot = Path(tmp, 'config_snapshot.bin')
+
+        timeit('legacy: two json passes', lambda: legacy_startup(directory))
+        timeit('repository: cold (parse once)', lambda: repo_startup(ConfigRepository(directory)))
+        repo = ConfigRepository(directory)
+        repo_startup(repo)
+        timeit('repository: warm (stat only)', lambda: repo_startup(repo))
+        ConfigRepository(directory, snapshot).categories()  # writes the snapshot
+        timeit('repository: new session, snapshot', lambda: repo_startup(ConfigRepository(directory, snapshot)))
+
+        merged, categories = repo_startup(repo)
+        print(f'{len(categories)} categories, {len(merged)} configs')
+
+
+if __name__ == '__main__':
+    main()
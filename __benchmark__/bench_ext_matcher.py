@@ -0,0 +1,50 @@
+"""
+Micro-benchmark of file extension matching over 100k file names.
+Run with: python __benchmark__/bench_ext_matcher.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ext_matcher import ExtensionMatcher
+
+EXT_STR = '.fbx;.obj;.stl;.ply;.abc;.usd;.usda;.usdc;.usdz;.glb;.gltf;.dae;.x3d;.wrl;.blend1;.tar.gz'
+SUFFIXES = ['.fbx', '.FBX', '.obj', '.OBJ', '.png', '.jpg', '.txt', '.blend1', '.tar.gz', '.usdz', '.exr', '']
+COUNT = 100_000
+
+
+def check_extension(filename, ext_str: str) -> bool:
+    """the matcher before ExtensionMatcher: split on every call, case-sensitive"""
+    if ';' not in ext_str:
+        return filename.endswith(ext_str)
+    else:
+        exts = ext_str.split(';')
+        for ext in exts:
+            if filename.endswith(ext): return True
+        return False
+
+
+def bench(name: str, func, filenames: list[str]) -> int:
+    start = time.perf_counter()
+    count = sum(1 for f in filenames if func(f))
+    elapsed = time.perf_counter() - start
+    print(f'{name:<24} {elapsed * 1000:8.1f} ms  {elapsed / len(filenames) * 1e9:6.0f} ns/file  matched {count}')
+    return count
+
+
+def main():
+    rng = random.Random(0)
+    filenames = [f'asset_{i:06d}.v{rng.randint(1, 9)}{rng.choice(SUFFIXES)}' for i in range(COUNT)]
+
+    bench('split + endswith', lambda f: check_extension(f, EXT_STR), filenames)
+    start = time.perf_counter()
+    matcher = ExtensionMatcher(EXT_STR)
+    print(f'{"compile":<24} {(time.perf_counter() - start) * 1e6:8.1f} us')
+    bench('ExtensionMatcher', matcher.match, filenames)
+
+
+if __name__ == '__main__':
+    main()
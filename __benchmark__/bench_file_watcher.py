@@ -0,0 +1,84 @@
+"""
+Cost of one watcher poll over 1,000 files, and how many polls a full sweep of the files takes.
+Run with: python __benchmark__/bench_file_watcher.py
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from file_watcher import DirWatcher
+
+FILES = 1000
+SUBDIRS = 10
+POLLS = 200
+
+
+def write_files(root: Path) -> list[Path]:
+    paths = []
+    for i in range(FILES):
+        directory = root / f'dir_{i % SUBDIRS:02d}'
+        directory.mkdir(exist_ok=True)
+        path = directory / f'script_{i:04d}.py'
+        path.write_text('print("hello")\n')
+        paths.append(path)
+    return paths
+
+
+def full_scan(root: str) -> dict:
+    """stat every file on each tick"""
+    stamps = {}
+    for directory, _, filenames in os.walk(root):
+        for name in filenames:
+            st = os.stat(os.path.join(directory, name))
+            stamps[name] = (st.st_mtime_ns, st.st_size)
+    return stamps
+
+
+def main():
+    with tempfile.TemporaryDirectory(prefix='cdi_bench_') as tmp:
+        root = Path(tmp)
+        paths = write_files(root)
+
+        start = time.perf_counter()
+        full_scan(tmp)
+        print(f'{"full scan per tick":<28} {(time.perf_counter() - start) * 1000:8.3f} ms')
+
+        watcher = DirWatcher(root, suffixes=('.py',))
+        start = time.perf_counter()
+        watcher.poll()
+        print(f'{"first poll (fingerprints)":<28} {(time.perf_counter() - start) * 1000:8.3f} ms')
+
+        times = []
+        for _ in range(POLLS):
+            start = time.perf_counter()
+            watcher.poll()
+            times.append(time.perf_counter() - start)
+        times.sort()
+        print(f'{"poll, no change":<28} {times[len(times) // 2] * 1000:8.3f} ms median  '
+              f'{times[-1] * 1000:.3f} ms max')
+
+        # a modified file is found within a full sweep
+        target = paths[FILES // 2]
+        target.write_text('print("changed")\n')
+        new = root / 'dir_00' / 'new.py'
+        new.write_text('')
+        paths[0].unlink()
+        added, removed, modified = set(), set(), set()
+        polls = 0
+        while target.as_posix() not in {Path(p).as_posix() for p in modified} and polls < POLLS:
+            a, r, m = watcher.poll()
+            added |= a
+            removed |= r
+            modified |= m
+            polls += 1
+        print(f'change found after {polls} polls: added {len(added)}, removed {len(removed)}, '
+              f'modified {len(modified)}')
+        print(watcher.stats())
+
+
+if __name__ == '__main__':
+    main()
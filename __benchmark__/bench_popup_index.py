@@ -0,0 +1,78 @@
+"""
+Clipboard popup with 5,000 pasted paths: most common extension + importer lookup for the menu.
+Run with: python __benchmark__/bench_popup_index.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ext_matcher import ExtensionIndex, ExtensionMatcher, most_common_suffix
+
+SUFFIXES = ['.fbx', '.FBX', '.obj', '.OBJ', '.png', '.jpg', '.txt', '.blend1', '.usdz', '.exr', '']
+AREAS = ['VIEW_3D', 'NODE_EDITOR', 'IMAGE_EDITOR', 'TEXT_EDITOR']
+FILES = 5_000
+CONFIGS = 200
+
+
+class Handle():
+    """what the popup reads from a registered file handler"""
+
+    def __init__(self, i: int, rng: random.Random):
+        self.poll_area = rng.choice(AREAS)
+        self.bl_import_operator = f'cdi.import_{i}'
+        self.bl_file_extensions = ';'.join(rng.sample(SUFFIXES[:-1], 3))
+        self.ext_matcher = ExtensionMatcher(self.bl_file_extensions)
+
+
+def legacy_filter_files(files: list[Path]) -> list[Path]:
+    exts = [file.suffix.lower() for file in files]
+    ext = max(set(exts), key=exts.count)
+    return [file for file in files if file.suffix.lower() == ext]
+
+
+def legacy_filter_operator(handles: list[Handle], area: str, filename: str) -> list[str]:
+    ops = []
+    for handle in handles:
+        if area != handle.poll_area: continue
+        if ExtensionMatcher(handle.bl_file_extensions).match(filename):
+            ops.append(handle.bl_import_operator)
+    return ops
+
+
+def timed(name: str, func, repeat: int = 5):
+    """best of repeat runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    print(f'{name:<28} {best * 1000:8.2f} ms')
+    return result
+
+
+def main():
+    rng = random.Random(0)
+    files = [Path(f'D:/assets/{i // 100:03d}/asset_{i:05d}{rng.choice(SUFFIXES)}') for i in range(FILES)]
+    handles = [Handle(i, rng) for i in range(CONFIGS)]
+    index = ExtensionIndex()
+    timed('build index', lambda: index.build((h.poll_area, h.ext_matcher, h.bl_import_operator) for h in handles))
+
+    def legacy():
+        kept = legacy_filter_files(files)
+        return kept, legacy_filter_operator(handles, 'VIEW_3D', kept[0].name)
+
+    def indexed():
+        kept = most_common_suffix(files)
+        return kept, index.find('VIEW_3D', kept[0].name)
+
+    old = timed(f'legacy popup ({FILES} paths)', legacy)
+    new = timed(f'indexed popup ({FILES} paths)', indexed)
+    assert old[0] == new[0] and sorted(old[1]) == sorted(new[1])
+    print(f'kept {len(new[0])} files, {len(new[1])} importers')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Wall time of registering the configs, eager vs lazy, for a growing number of configs.
+
+Run with: python __benchmark__/bench_register.py --blender /path/to/blender [--counts 10,100,500,1000]
+Modes:
+    eager  an operator and a file handler per config
+    lazy   file handlers only, operators are registered on first use
+"""
+import importlib
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ADDON_DIR = Path(__file__).parent.parent
+MODES = ('eager', 'lazy')
+OPERATORS = ('wm.obj_import', 'wm.stl_import', 'wm.ply_import', 'import_scene.fbx', 'import_scene.gltf')
+
+
+def gen_configs(count: int) -> dict[str, dict[str, dict]]:
+    configs = {}
+    for i in range(count):
+        configs[f'Bench Importer {i:04d}'] = {
+            'bl_import_operator': OPERATORS[i % len(OPERATORS)],
+            'bl_file_extensions': f'.b{i:04d};.c{i:04d}',
+            'poll_area': 'VIEW_3D',
+            'operator_context': 'EXEC_DEFAULT',
+        }
+    return {'bench': configs}
+
+
+def run_in_blender(counts: list[int]):
+    """executed inside blender"""
+    sys.path.insert(0, str(ADDON_DIR.parent))
+    _runtime = importlib.import_module(f'{ADDON_DIR.name}._runtime')
+
+    with tempfile.TemporaryDirectory(prefix='cdi_bench_') as directory:
+        # do not touch the idnames of the installed addon
+        _runtime.G_idname_map = _runtime.IdnameMap(Path(directory, 'idnames.json'))
+        for count in counts:
+            configs = gen_configs(count)
+            for mode in MODES:
+                start = time.perf_counter()
+                _runtime.ensure_op_handles(configs, lazy=mode == 'lazy')
+                elapsed = time.perf_counter() - start
+
+                label = next(iter(configs['bench']))
+                start = time.perf_counter()
+                _runtime.materialize_op(label)
+                first_use = time.perf_counter() - start
+
+                print(f'CDI_BENCH configs={count:<5} {mode:<6} register={elapsed * 1000:8.1f} ms '
+                      f'first_use={first_use * 1000:6.2f} ms', flush=True)
+                _runtime.ensure_op_handles({})  # unregister all
+
+
+def main():
+    argv = sys.argv[1:]
+    blender = argv[argv.index('--blender') + 1] if '--blender' in argv else 'blender'
+    counts = argv[argv.index('--counts') + 1] if '--counts' in argv else '10,100,500,1000'
+
+    cmd = [blender, '-b', '--factory-startup', '--python', __file__, '--', '--counts', counts]
+    result = subprocess.run(cmd, capture_output=True, text=True, errors='replace')
+    lines = [line for line in result.stdout.splitlines() if line.startswith('CDI_BENCH')]
+    print('\n'.join(lines) if lines else f'failed\n{result.stdout[-2000:]}\n{result.stderr[-2000:]}')
+
+
+if __name__ == '__main__':
+    if '--' in sys.argv:
+        _argv = sys.argv[sys.argv.index('--') + 1:]
+        run_in_blender([int(c) for c in _argv[_argv.index('--counts') + 1].split(',')])
+    else:
+        main()
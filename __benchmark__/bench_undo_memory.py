@@ -0,0 +1,118 @@
+"""
+Peak memory (RSS) of a big drop with different undo settings.
+Each mode runs in its own Blender process, since peak RSS only grows.
+
+Run with: python __benchmark__/bench_undo_memory.py --blender /path/to/blender [--files 300] [--window]
+Modes:
+    legacy   generated operator without bl_options, every nested import pushes an undo step
+    grouped  default, the whole drop is one undo step
+    no_undo  config with "no_undo", global undo is suspended during the drop
+
+Blender may not create an undo stack in background mode (-b), use --window to measure undo with a window.
+"""
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ADDON_DIR = Path(__file__).parent.parent
+MODES = ('legacy', 'grouped', 'no_undo')
+
+
+def write_obj_files(directory: str, count: int, size: int = 64) -> list[str]:
+    """grid meshes of size * size vertices"""
+    lines = [f'v {x} {y} 0' for y in range(size) for x in range(size)]
+    for y in range(size - 1):
+        for x in range(size - 1):
+            i = y * size + x + 1
+            lines.append(f'f {i} {i + 1} {i + size + 1} {i + size}')
+    data = '\n'.join(lines) + '\n'
+
+    names = []
+    for i in range(count):
+        name = f'grid_{i:04d}.obj'
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write(data)
+        names.append(name)
+    return names
+
+
+def peak_rss_mb() -> float:
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                 ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize / 1024 / 1024
+
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / 1024 if sys.platform == 'darwin' else rss / 1024
+
+
+def run_in_blender(mode: str, directory: str):
+    """executed inside blender"""
+    import bpy
+    import time
+
+    sys.path.insert(0, str(ADDON_DIR.parent))
+    wrap_handle = importlib.import_module(f'{ADDON_DIR.name}.wrap_handle')
+
+    op = wrap_handle.gen_import_op(bl_idname='cdi.bench_undo', bl_label='Bench Undo',
+                                   bl_import_operator='wm.obj_import', bl_file_extensions='.obj',
+                                   operator_context='EXEC_DEFAULT', no_undo=mode == 'no_undo')
+    if mode == 'legacy':
+        op.bl_options = set()
+    bpy.utils.register_class(op)
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+    files = [{'name': f} for f in sorted(os.listdir(directory))]
+    before = peak_rss_mb()
+    start = time.perf_counter()
+    bpy.ops.cdi.bench_undo('EXEC_DEFAULT', directory=directory, files=files)
+    elapsed = time.perf_counter() - start
+
+    print(f'CDI_BENCH {mode} files={len(files)} time={elapsed:.2f}s '
+          f'peak_rss_before={before:.0f}MB peak_rss={peak_rss_mb():.0f}MB', flush=True)
+    bpy.utils.unregister_class(op)
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else sys.argv[1:]
+    blender = argv[argv.index('--blender') + 1] if '--blender' in argv else 'blender'
+    count = int(argv[argv.index('--files') + 1]) if '--files' in argv else 300
+
+    with tempfile.TemporaryDirectory(prefix='cdi_bench_') as directory:
+        write_obj_files(directory, count)
+        for mode in MODES:
+            cmd = [blender, '--factory-startup']
+            if '--window' not in argv: cmd.append('-b')
+            cmd += ['--python', __file__, '--', '--mode', mode, '--dir', directory]
+            result = subprocess.run(cmd, capture_output=True, text=True, errors='replace')
+            lines = [line for line in result.stdout.splitlines() if line.startswith('CDI_BENCH')]
+            print(lines[0] if lines else f'{mode}: failed\n{result.stdout[-2000:]}\n{result.stderr[-2000:]}')
+
+
+if __name__ == '__main__':
+    _argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    if '--mode' in _argv:
+        run_in_blender(_argv[_argv.index('--mode') + 1], _argv[_argv.index('--dir') + 1])
+        if '-b' not in sys.argv and '--background' not in sys.argv:
+            import bpy
+
+            bpy.ops.wm.quit_blender()
+    else:
+        main()
@@ -15,8 +15,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
 
 
 def register():
-    _runtime.register()
+    # preferences first, they are read when registering the import operators
     display.register()
+    _runtime.register()
     keymap.register()
     translations.register()
 
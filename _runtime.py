@@ -1,53 +1,318 @@
 import json
 import bpy
+import hashlib
+import re
 from pathlib import Path
 import sys
 
-from .public_path import AssetDir, get_AssetDir_path
-from .wrap_handle import gen_import_op, gen_import_handle
+from .public_path import get_IdnameMapFile, write_atomic
+from .config_repo import G_config_repo
+from .wrap_handle import gen_import_op, gen_import_handle, check_import_operator
+from .ext_matcher import ExtensionIndex, most_common_suffix
+from . import import_dedup, import_queue, hot_reload
 
 
-G_ops = {}
+G_ops = {}  # label: import operator, only the used ones when registered lazily
 G_handles = {}
+G_op_errors = {}  # label: error message of invalid import operator, also of the ones not registered yet
+G_register_failed: set[str] = set()  # labels whose import operator can not be registered, until changed
+G_configs = {}  # label: (category, config values) of the registered classes
+G_idnames = {}  # label: idname suffix of the registered classes
+G_materialize_pending: set[str] = set()  # labels polled by a drop, registered on the next timer tick
+G_ext_index = ExtensionIndex()  # (poll_area, extension): import operator idnames, for the popup operator
+# class attributes that can be changed on a registered import operator
+C_OP_PATCH_ATTRS = (
+    'bl_import_operator', 'bl_file_extensions', 'ext_matcher', 'operator_context',
+    'use_batch_import', 'batch_import', 'parallel_import', 'dedup_import', 'queued_import', 'kwargs',
+    'pre_script', 'post_script', 'foreach_pre_script', 'foreach_post_script',
+    'op_callable', 'op_props', 'op_error',
+)
+# config keys read by the file handler at registration
+C_HANDLE_KEYS = ('bl_file_extensions', 'poll_area')
+# config keys that change bl_options of the import operator, which is read at registration
+C_OP_REGISTER_KEYS = ('no_undo', 'queued_import')
 
 
-def ensure_op_handles():
-    datas = {}
-    # get configs dict from path
-    for file in get_AssetDir_path(AssetDir.CONFIG).iterdir():
-        with open(file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            datas.update(data)
-    # register in op
-    for index, (label, values) in enumerate(datas.items()):
-        new_idname = f'cdi.import_{index}'
-        op = gen_import_op(
-            bl_label=label,
-            bl_idname=new_idname,
-            bl_import_operator=values['bl_import_operator'],
-            bl_file_extensions=values['bl_file_extensions'],
-            operator_context=values.get('operator_context', 'INVOKE_DEFAULT'),
-        )
+class IdnameMap():
+    """
+    Persisted {category/label: idname suffix}, so a config keeps its operator idname across reloads
+    no matter where it is in the config files. New configs get a sanitized label plus a hash of category/label.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.map: dict[str, str] = {}
+        self._loaded = False
+        self._dirty = False
+
+    @staticmethod
+    def config_key(category: str, label: str) -> str:
+        return f'{category}/{label}'
+
+    @staticmethod
+    def new_suffix(category: str, label: str) -> str:
+        name = re.sub(r'[^a-z0-9]+', '_', label.lower()).strip('_')[:24]
+        digest = hashlib.sha1(IdnameMap.config_key(category, label).encode('utf-8')).hexdigest()[:8]
+        return f'{name}_{digest}' if name else digest
+
+    def load(self):
+        if self._loaded: return
+        self._loaded = True
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.map = json.load(f)
+        except (OSError, ValueError):
+            self.map = {}
+
+    def get(self, category: str, label: str) -> str:
+        self.load()
+        key = self.config_key(category, label)
+        if key in self.map: return self.map[key]
+
+        used = set(self.map.values())
+        base = suffix = self.new_suffix(category, label)
+        n = 2
+        while suffix in used:  # hash collision
+            suffix = f'{base}_{n}'
+            n += 1
+        self.map[key] = suffix
+        self._dirty = True
+        return suffix
+
+    def save(self):
+        if not self._dirty: return
+        try:
+            write_atomic(self.path, json.dumps(self.map, indent=4))
+        except OSError as e:  # kept dirty, saved again with the next change
+            print(f'CDI: can not write operator idnames: {e}')
+            return
+        self._dirty = False
+
+
+G_idname_map = IdnameMap(get_IdnameMapFile())
+
+
+def op_idname(label: str) -> str:
+    return f'cdi.import_{G_idnames[label]}'
+
+
+def gen_op(label: str, values: dict) -> type:
+    return gen_import_op(
+        bl_label=label,
+        bl_idname=op_idname(label),
+        bl_import_operator=values['bl_import_operator'],
+        bl_file_extensions=values['bl_file_extensions'],
+        operator_context=values.get('operator_context', 'INVOKE_DEFAULT'),
+        batch_import=values.get('batch_import', False),
+        parallel_import=values.get('parallel_import', False),
+        dedup_import=values.get('dedup_import', False),
+        no_undo=values.get('no_undo', False),
+        queued_import=values.get('queued_import', False),
+        poll_area=values['poll_area'],
         # external scripts
-        op.pre_script = values.get('pre_script')
-        op.post_script = values.get('post_script')
-        op.foreach_pre_script = values.get('foreach_pre_script')
-        op.foreach_post_script = values.get('foreach_post_script')
+        pre_script=values.get('pre_script'),
+        post_script=values.get('post_script'),
+        foreach_pre_script=values.get('foreach_pre_script'),
+        foreach_post_script=values.get('foreach_post_script'),
+    )
+
+
+def gen_handle(label: str, values: dict, lazy: bool = False) -> type:
+    """:param lazy: the import operator is not registered yet, request it when a drop is polled"""
+    handle = gen_import_handle(
+        bl_label=label,
+        bl_import_operator=op_idname(label),
+        bl_idname=f"CDI_FH_handle_{G_idnames[label]}",
+        bl_file_extensions=values['bl_file_extensions'],
+        poll_area=values['poll_area'],
+        materialize=(lambda: request_materialize(label)) if lazy else None,
+    )
+    handle.poll_area = values['poll_area']
+    return handle
+
+
+def config_error(values: dict, cache: dict = None) -> str:
+    """
+    error of the import operator of a config not registered yet
+    :param cache: errors by (operator, batch import) for one pass over many configs sharing operators
+    """
+    key = (values['bl_import_operator'], values.get('batch_import', False))
+    if cache is not None and key in cache: return cache[key]
+    error = check_import_operator(*key)[3]
+    if cache is not None: cache[key] = error
+    return error
+
+
+def materialize_op(label: str) -> bool:
+    """
+    generate and register the import operator of a config on first use
+    :return: False if the config is gone or the operator can not be registered
+    """
+    if label in G_ops: return True
+    # gone, or failed before and not changed since
+    if label not in G_configs or label in G_register_failed: return False
+    op = gen_op(label, G_configs[label][1])
+    try:
+        bpy.utils.register_class(op)
+    except (RuntimeError, ValueError) as e:
+        print(f'CDI: can not register import operator of "{label}": {e}')
+        G_op_errors[label] = str(e)
+        G_register_failed.add(label)
+        return False
+    G_ops[label] = op
+    if op.op_error:
+        G_op_errors[label] = op.op_error
+    else:
+        G_op_errors.pop(label, None)
+    return True
+
+
+def request_materialize(label: str) -> bool:
+    """
+    drop poll of a lazy config, classes are not registered inside a poll:
+    the import operator is registered by a timer, the next poll of the same drag accepts it
+    :return: True if the import operator is registered
+    """
+    if label in G_ops: return True
+    if label not in G_configs or label in G_register_failed: return False
+    G_materialize_pending.add(label)
+    if not bpy.app.timers.is_registered(materialize_pending):
+        bpy.app.timers.register(materialize_pending, first_interval=0.0)
+    return False
+
 
-        # handle
-        handle = gen_import_handle(
-            bl_label=label,
-            bl_import_operator=new_idname,
-            bl_idname=f"CDI_FH_handle{index}",
-            bl_file_extensions=values['bl_file_extensions'],
-            poll_area=values['poll_area']
-        )
-        handle.poll_area = values['poll_area']
+def materialize_pending():
+    labels = list(G_materialize_pending)
+    G_materialize_pending.clear()
+    for label in labels:
+        materialize_op(label)
+    return None
 
-        G_ops.update({label: op})
-        G_handles.update({label: handle})
 
-    # print(G_ops, G_handles)
+def materialize_idnames(idnames: list[str]) -> list[str]:
+    """:return: the import operator idnames that are registered"""
+    labels = {op_idname(label): label for label in G_configs}
+    return [idname for idname in idnames if idname in labels and materialize_op(labels[idname])]
+
+
+def is_lazy() -> bool:
+    try:
+        from .display import get_pref
+        return get_pref().lazy_register
+    except (KeyError, AttributeError):
+        return False
+
+
+def _safe_unregister(cls):
+    if cls is None: return
+    try:
+        bpy.utils.unregister_class(cls)
+    except RuntimeError:
+        pass
+
+
+def ensure_op_handles(cat_datas: dict[str, dict[str, dict]] = None, lazy: bool = None) -> dict[str, int]:
+    """
+    register / unregister / patch only the configs that changed since the last call
+    :param cat_datas: configs {category: {label: values}}, from the config repository if None
+    :param lazy: register only the file handlers of new configs, their operators are registered on first use.
+    from the preferences if None
+    :return: count of configs added / removed / changed, and classes (un)registered
+    """
+    if cat_datas is None:
+        datas = G_config_repo.merged()
+    else:
+        # merge, the same label in a later category wins
+        datas = {}
+        for category, data in cat_datas.items():
+            for label, values in data.items():
+                datas[label] = (category, values)
+    if lazy is None:
+        lazy = is_lazy()
+    counts = {'added': 0, 'removed': 0, 'changed': 0, 'classes': 0}
+    errors = {}  # of the configs not registered yet, by operator
+
+    # removed, or moved to another category which gives another idname
+    for label in [label for label in G_configs if label not in datas or datas[label][0] != G_configs[label][0]]:
+        _safe_unregister(G_ops.pop(label, None))
+        _safe_unregister(G_handles.pop(label))
+        G_configs.pop(label)
+        G_idnames.pop(label)
+        G_op_errors.pop(label, None)
+        G_register_failed.discard(label)
+        counts['removed'] += 1
+        counts['classes'] += 2
+
+    for label, (category, values) in datas.items():
+        old_values = G_configs[label][1] if label in G_configs else None
+        if old_values == values: continue
+
+        if old_values is None:
+            G_idnames[label] = G_idname_map.get(category, label)
+            if not lazy:
+                G_ops[label] = gen_op(label, values)
+                bpy.utils.register_class(G_ops[label])
+                counts['classes'] += 1
+            G_handles[label] = gen_handle(label, values, lazy=lazy)
+            bpy.utils.register_class(G_handles[label])
+            counts['added'] += 1
+            counts['classes'] += 1
+        elif label not in G_ops:
+            # not used yet, generated from the new values on first use
+            if any(old_values.get(k) != values.get(k) for k in C_HANDLE_KEYS):
+                _safe_unregister(G_handles[label])
+                G_handles[label] = gen_handle(label, values, lazy=True)
+                bpy.utils.register_class(G_handles[label])
+                counts['classes'] += 1
+            counts['changed'] += 1
+        else:
+            op = gen_op(label, values)
+            if any(old_values.get(k, False) != values.get(k, False) for k in C_OP_REGISTER_KEYS):
+                _safe_unregister(G_ops[label])
+                bpy.utils.register_class(op)
+                G_ops[label] = op
+                counts['classes'] += 1
+            else:
+                for attr in C_OP_PATCH_ATTRS:
+                    setattr(G_ops[label], attr, op.__dict__[attr])
+
+            if any(old_values.get(k) != values.get(k) for k in C_HANDLE_KEYS):
+                _safe_unregister(G_handles[label])
+                G_handles[label] = gen_handle(label, values)
+                bpy.utils.register_class(G_handles[label])
+                counts['classes'] += 1
+            counts['changed'] += 1
+
+        G_configs[label] = (category, dict(values))
+        G_register_failed.discard(label)
+        error = G_ops[label].op_error if label in G_ops else config_error(values, errors)
+        if error:
+            G_op_errors[label] = error
+        else:
+            G_op_errors.pop(label, None)
+
+    G_idname_map.save()
+    if counts['added'] or counts['removed'] or counts['changed']:
+        G_ext_index.build((handle.poll_area, handle.ext_matcher, handle.bl_import_operator)
+                          for handle in G_handles.values())
+    return counts
+
+
+def refresh_op_errors():
+    """resolve invalid operators again, they may come from addons registered after this one"""
+    for label in list(G_op_errors.keys()):
+        if label in G_register_failed: continue
+        op = G_ops.get(label)
+        if op is not None:
+            error = op.resolve()
+        elif label in G_configs:
+            error = config_error(G_configs[label][1])
+        else:
+            error = ''
+        if error:
+            G_op_errors[label] = error
+        else:
+            G_op_errors.pop(label)
 
 
 class CDI_OT_popup_operator(bpy.types.Operator):
@@ -55,19 +320,11 @@ class CDI_OT_popup_operator(bpy.types.Operator):
     bl_idname = "cdi.popup_operator"
 
     def filter_files(self, files) -> list[Path]:
-        # get the most common extension
-        exts = [file.suffix for file in files]
-        ext = max(set(exts), key=exts.count)
-        return [file for file in files if file.suffix == ext]
-
-    def filter_operator(self, context, bl_file_extensions) -> list[str]:
-        split_exts = lambda exts: exts.split(';')
-        ops = []
-        for handle in G_handles.values():
-            if context.area.type != handle.poll_area: continue
-            if bl_file_extensions in split_exts(handle.bl_file_extensions):
-                ops.append(handle.bl_import_operator)
-        return ops
+        # keep the most common extension
+        return most_common_suffix(files)
+
+    def filter_operator(self, context, filename: str) -> list[str]:
+        return materialize_idnames(G_ext_index.find(context.area.type, filename))
 
     def execute(self, context):
         from . import clipboard
@@ -89,11 +346,13 @@ class CDI_OT_popup_operator(bpy.types.Operator):
         directory = files[0].parent
         bl_file_extensions = files[0].suffix
         clipboard_files = ';'.join([file.name for file in files])
+        # registered here, not while drawing the menu
+        bl_idnames = self.filter_operator(context, files[0].name)
 
         def draw(_self, _context):
             _self.layout.operator_context = 'INVOKE_DEFAULT'
             _self.layout.label(text=f"Import {bl_file_extensions} files")
-            for bl_idname in self.filter_operator(context, bl_file_extensions):
+            for bl_idname in bl_idnames:
                 op = _self.layout.operator(bl_idname)
                 op.directory = str(directory)
                 op.clipboard_files = clipboard_files
@@ -111,15 +370,16 @@ def register():
 
     ensure_op_handles()
 
-    import bpy
-    for op in G_ops.values():
-        bpy.utils.register_class(op)
-    for handle in G_handles.values():
-        bpy.utils.register_class(handle)
-
     if sys.platform == 'win32':
         bpy.utils.register_class(CDI_OT_popup_operator)
 
+    if G_op_errors:
+        bpy.app.timers.register(refresh_op_errors, first_interval=1)
+
+    import_dedup.register()
+    import_queue.register()
+    hot_reload.register()
+
 
 def unregister():
     import bpy
@@ -136,5 +396,17 @@ def unregister():
     if sys.platform == 'win32':
         bpy.utils.unregister_class(CDI_OT_popup_operator)
 
+    import_dedup.unregister()
+    import_queue.unregister()
+    hot_reload.unregister()
+
+    if bpy.app.timers.is_registered(materialize_pending):
+        bpy.app.timers.unregister(materialize_pending)
+    G_materialize_pending.clear()
     G_ops.clear()
     G_handles.clear()
+    G_op_errors.clear()
+    G_register_failed.clear()
+    G_configs.clear()
+    G_idnames.clear()
+    G_ext_index.build(())
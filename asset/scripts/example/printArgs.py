@@ -1,3 +1,4 @@
+"""Print the arguments passed to the script"""
 import bpy
 
 from cdi_tool.debugLog import DebugLog
@@ -8,6 +9,8 @@ filepath = globals().get('filepath')
 index = globals().get('index')
 selected_objects = globals().get('selected_objects')
 selected_nodes = globals().get('selected_nodes')
+new_objects = globals().get('new_objects')  # objects created by this file (foreach post script)
+new_datablocks = globals().get('new_datablocks')  # {'objects': [...], 'meshes': [...], ...}
 # all
 directory = globals().get('directory')
 files = globals().get('files')
@@ -18,5 +21,7 @@ logger.debug(f'event:{event}\n'
              f'index:{index}\n'
              f'selected_objects:{selected_objects}\n'
              f'selected_nodes:{selected_nodes}\n'
+             f'new_objects:{new_objects}\n'
+             f'new_datablocks:{new_datablocks}\n'
              f'directory:{directory}\n'
              f'files:{files}\n')
@@ -1,2 +1,6 @@
+"""Frame the selected objects in the 3D View"""
 import bpy
+
+CDI_PHASES = ('post_script',)
+
 bpy.ops.view3d.view_selected(use_all_regions=False)
\ No newline at end of file
@@ -1,3 +1,4 @@
+"""Move the objects of each file to a collection named after the file"""
 import bpy
 from pathlib import Path
 
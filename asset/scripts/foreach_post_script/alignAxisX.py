@@ -1,3 +1,4 @@
+"""Place the objects of each file in a row along the X axis"""
 import bpy
 
 index = globals().get('index')
@@ -1,3 +1,4 @@
+"""Move the objects of each file onto the floor"""
 import bpy
 from cdi_tool.boundingBox import ObjectBoundingBox, ObjectsBoundingBox, C_OBJECT_TYPE_HAS_BBOX
 from cdi_tool.debugLog import DebugLog
@@ -1,3 +1,4 @@
+"""Drop the imported objects onto the surface under the mouse"""
 import bpy
 from mathutils import Vector
 from cdi_tool.boundingBox import ObjectBoundingBox, ObjectsBoundingBox, C_OBJECT_TYPE_HAS_BBOX
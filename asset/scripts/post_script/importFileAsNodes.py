@@ -1,3 +1,4 @@
+"""Add the dropped images as image texture nodes"""
 import bpy
 import os
 
@@ -1,3 +1,4 @@
+"""Set up a PBR material from the dropped textures with Node Wrangler"""
 import bpy
 import os
 import addon_utils
@@ -0,0 +1,76 @@
+class ConfigFilter():
+    """
+    Filter / sort data of the config list.
+    Rows are copied from the collection only after an edit, results are cached per query,
+    so a redraw without edit costs a dict lookup.
+    """
+
+    def __init__(self):
+        self.dirty = True
+        self._names: list[str] = []
+        self._haystacks: list[str] = []  # lower case 'name\nextensions\noperator' searched by substring
+        self._has_script: list[bool] = []
+        self._categories: dict[str, list[int]] = {}  # category: item indexes
+        self._flags: dict[tuple[str, str, int], list[int]] = {}  # (category, search, bitflag): flags
+        self._order: list[int] | None = None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def rebuild(self, rows):
+        """
+        :param rows: iterable of (category, name, extensions, operator, has script) in collection order
+        """
+        names, haystacks, has_script, categories = [], [], [], {}
+        for index, (category, name, extensions, operator, script) in enumerate(rows):
+            names.append(name)
+            haystacks.append(f'{name}\n{extensions}\n{operator}'.lower())
+            has_script.append(script)
+            categories.setdefault(category, []).append(index)
+
+        self._names = names
+        self._haystacks = haystacks
+        self._has_script = has_script
+        self._categories = categories
+        self._flags.clear()
+        self._order = None
+        self.dirty = False
+
+    def filter(self, category: str, search: str, bitflag: int) -> list[int]:
+        """
+        :param search: case-insensitive substring of the name, extensions or operator, all if empty
+        :return: bitflag for the shown items, 0 for the others
+        """
+        search = search.lower()
+        key = (category, search, bitflag)
+        flags = self._flags.get(key)
+        if flags is None:
+            if len(self._flags) > 64: self._flags.clear()  # typed searches
+            flags = [0] * len(self._names)
+            haystacks = self._haystacks
+            for index in self._categories.get(category, ()):
+                if not search or search in haystacks[index]:
+                    flags[index] = bitflag
+            self._flags[key] = flags
+        return flags
+
+    def order(self, sort_items_helper) -> list[int]:
+        """
+        :param sort_items_helper: UI_UL_list.sort_items_helper
+        :return: new position of each item, sorted by name
+        """
+        if self._order is None:
+            self._order = sort_items_helper(list(enumerate(self._names)), lambda e: e[1].lower())
+        return self._order
+
+    def categories(self) -> list[str]:
+        return list(self._categories)
+
+    def has_script(self, index: int) -> bool:
+        return index < len(self._has_script) and self._has_script[index]
+
+
+G_config_filter = ConfigFilter()
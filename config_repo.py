@@ -0,0 +1,155 @@
+import json
+import marshal
+import os
+from pathlib import Path
+
+from .public_path import get_ConfigDir, get_ConfigSnapshotFile, write_atomic
+
+DEFAULT_CONFIG = {'New Importer': {'bl_import_operator': '', 'bl_file_extensions': '.txt',
+                                   'poll_area': 'VIEW_3D', 'operator_context': 'EXEC_DEFAULT'}}
+# bump when the snapshot layout changes
+C_SNAPSHOT_VERSION = 1
+
+
+class ConfigRepository():
+    """
+    Parsed config files of the config folder, shared by registration, the config list and the popup operator.
+    Each file is parsed once and cached by path + mtime/size, only changed files are parsed again.
+    The parsed files are also kept in a marshal snapshot, so a new session does not parse json
+    as long as no file changed since.
+    """
+
+    def __init__(self, directory: Path, snapshot: Path = None):
+        self.directory = Path(directory)
+        self.snapshot = snapshot
+        self._files: dict[str, tuple[tuple[int, int], str, dict]] = {}  # path: (stamp, category, data)
+        self._categories: dict[str, dict[str, dict]] | None = None
+        self._merged: dict[str, tuple[str, dict]] | None = None
+        self._rows: list[tuple[str, str, dict]] | None = None
+
+    def _scan(self) -> dict[str, tuple[tuple[int, int], str]]:
+        files = {}
+        try:
+            entries = sorted(os.scandir(self.directory), key=lambda e: e.name)
+        except FileNotFoundError:
+            return files
+        for entry in entries:
+            if not entry.name.endswith('.json') or not entry.is_file(): continue
+            st = entry.stat()
+            files[entry.path] = ((st.st_mtime_ns, st.st_size), entry.name[:-len('.json')])
+        return files
+
+    def refresh(self) -> set[str]:
+        """
+        parse new and changed files, forget removed ones
+        :return: categories that changed
+        """
+        changed = set()
+        scanned = self._scan()
+        if not self._files:
+            self.load_snapshot(scanned)
+        parsed = False
+
+        for path in [path for path in self._files if path not in scanned]:
+            changed.add(self._files.pop(path)[1])
+
+        for path, (stamp, category) in scanned.items():
+            cached = self._files.get(path)
+            if cached is not None and cached[0] == stamp: continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (ValueError, OSError) as e:
+                # often half written by an external editor, parsed again when it changes
+                print(f'CDI: can not read config {path}: {e}')
+                self._files[path] = (stamp, category, cached[2] if cached is not None else {})
+                if cached is None: changed.add(category)
+                continue
+            self._files[path] = (stamp, category, data)
+            changed.add(category)
+            parsed = True
+
+        if changed or self._categories is None:
+            self._categories = {category: data for _, (_, category, data) in sorted(self._files.items())}
+            self._merged = None
+            self._rows = None
+        if parsed:
+            self.save_snapshot()
+        return changed
+
+    def categories(self) -> dict[str, dict[str, dict]]:
+        """:return: {category: {label: values}}, shared data, do not modify"""
+        self.refresh()
+        return self._categories
+
+    def known_categories(self) -> list[str]:
+        """categories of the last refresh, without scanning the folder"""
+        if self._categories is None: self.refresh()
+        return list(self._categories)
+
+    def merged(self) -> dict[str, tuple[str, dict]]:
+        """:return: {label: (category, values)}, the same label in a later category wins"""
+        categories = self.categories()
+        if self._merged is None:
+            self._merged = {label: (category, values)
+                            for category, datas in categories.items()
+                            for label, values in datas.items()}
+        return self._merged
+
+    def rows(self) -> list[tuple[str, str, dict]]:
+        """:return: [(category, label, values)] in display order, shared data, do not modify"""
+        categories = self.categories()
+        if self._rows is None:
+            self._rows = [(category, label, values)
+                          for category, datas in categories.items()
+                          for label, values in datas.items()]
+        return self._rows
+
+    def load_snapshot(self, scanned: dict[str, tuple[tuple[int, int], str]]) -> bool:
+        """
+        fill the cache from the snapshot if it was written from exactly the scanned files
+        :return: loaded
+        """
+        if self.snapshot is None: return False
+        try:
+            with open(self.snapshot, 'rb') as f:
+                version, py_version, files = marshal.loads(f.read())  # load(f) reads in small chunks
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+        if (version, py_version) != (C_SNAPSHOT_VERSION, marshal.version): return False
+        if {path: (stamp, category) for path, (stamp, category, _) in files.items()} != scanned: return False
+        self._files = files
+        return True
+
+    def save_snapshot(self):
+        if self.snapshot is None: return
+        try:
+            self.snapshot.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.snapshot, marshal.dumps((C_SNAPSHOT_VERSION, marshal.version, self._files)))
+        except (OSError, ValueError) as e:  # ValueError: data marshal can not write
+            print(f'CDI: can not write config snapshot: {e}')
+
+    def save_category(self, category: str, data: dict, indent: int | None = 4):
+        """write one category file and keep it in cache without parsing it again"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = os.path.join(self.directory, f'{category}.json')
+        write_atomic(path, json.dumps(data, indent=indent, allow_nan=True))
+        st = os.stat(path)
+        self._files[path] = ((st.st_mtime_ns, st.st_size), category, data)
+        self._categories = None
+        self._merged = None
+        self._rows = None
+
+    def ensure_default(self):
+        """create the default config file if there is no config"""
+        if not self.categories():
+            self.save_category('default', DEFAULT_CONFIG)
+
+    def invalidate(self):
+        self._files.clear()
+        self._categories = None
+        self._merged = None
+        self._rows = None
+
+
+G_config_repo = ConfigRepository(get_ConfigDir(), get_ConfigSnapshotFile())
@@ -1,82 +1,224 @@
 import bpy
 import os
-from bpy.props import StringProperty, EnumProperty, BoolProperty, IntProperty, CollectionProperty
+import zlib
+from contextlib import contextmanager
+from bpy.props import StringProperty, EnumProperty, BoolProperty, IntProperty, FloatProperty, CollectionProperty
 
-from .public_path import AssetDir, get_AssetDir_path, get_ScriptDir, get_ConfigDir
+from .public_path import get_ScriptDir, get_ConfigDir, G_script_index
+from .config_repo import G_config_repo
+from .config_filter import G_config_filter
 from .public_data import area_type, operator_context, scripts_types
 
 
+G_dirty_categories: set[str] = set()  # categories edited since the last load / save
+G_loading = False  # no dirty flags while filling the list from the config files
+G_category_items: dict[tuple[str, ...], list] = {}  # keep a reference, blender does not copy enum strings
+
+
+def mark_category_dirty(item):
+    """the category file of an item needs to be written, and the one it was loaded from if it moved"""
+    G_dirty_categories.add(item.category)
+    if item.loaded_category:
+        G_dirty_categories.add(item.loaded_category)
+
+
+@contextmanager
+def suppress_dirty():
+    """edit items without marking their categories, the caller marks them once"""
+    global G_loading
+    loading, G_loading = G_loading, True
+    try:
+        yield
+    finally:
+        G_loading = loading
+
+
+def normalize_ext(ext: str) -> str:
+    """' obj' -> '.obj', '' if empty"""
+    ext = ext.strip()
+    if ext and not ext.startswith('.'):
+        ext = '.' + ext
+    return ext
+
+
+def get_config_categories(self, context):
+    """categories of the config files and of the list, a moved config can be in a category not saved yet"""
+    wm = context.window_manager if context else bpy.context.window_manager
+    names = set(G_config_repo.known_categories())
+    if G_config_filter.dirty:
+        names.update(item.category for item in wm.cdi_config_list)
+    else:
+        names.update(G_config_filter.categories())
+    key = tuple(sorted(names))
+    items = G_category_items.get(key)
+    if items is None:
+        G_category_items.clear()
+        # stable numbers, the selected category stays the same when one is added before it
+        items = G_category_items[key] = [(c, c, '', zlib.crc32(c.encode()) & 0x7FFFFFFF) for c in key]
+    return items
+
+
+def update_config_item(self, context):
+    G_config_filter.mark_dirty()
+    if not G_loading:
+        mark_category_dirty(self)
+
+
+def joined_property(list_attr: str, **kwargs) -> StringProperty:
+    """';' joined view of a string collection, the format of the config files"""
+
+    def get(self):
+        return ';'.join(entry.name for entry in getattr(self, list_attr))
+
+    def set(self, value):
+        entries = getattr(self, list_attr)
+        entries.clear()
+        for name in value.split(';'):
+            if name: entries.add().name = name
+
+    return StringProperty(get=get, set=set, update=update_config_item, **kwargs)
+
+
+class CDI_ConfigEntry(bpy.types.PropertyGroup):
+    """one file extension or script of a config"""
+    name: StringProperty()
+
+
 class CDI_ConfigItem(bpy.types.PropertyGroup):
-    name: StringProperty(name='Name', default='New Importer')
-    bl_import_operator: StringProperty(name='Operator', default='')
-    bl_file_extensions: StringProperty(name='File Extension', default='.txt')
+    name: StringProperty(name='Name', default='New Importer', update=update_config_item)
+    bl_import_operator: StringProperty(name='Operator', default='', update=update_config_item)
+    extensions: CollectionProperty(type=CDI_ConfigEntry)
+    bl_file_extensions: joined_property('extensions', name='File Extension')
     poll_area: EnumProperty(default='VIEW_3D', name='Area',
-                            items=[(k, v, '') for k, v in area_type.items()], )
+                            items=[(k, v, '') for k, v in area_type.items()], update=update_config_item)
     # custom
-    pre_script: StringProperty(name='Pre Script', description='Before Import All Files')
-    post_script: StringProperty(name='Post Script', description='After Import All Files')
-    foreach_pre_script: StringProperty(name='Foreach Pre Script', description='Before Import Each File')
-    foreach_post_script: StringProperty(name='Foreach Post Script', description='After Import Each File')
+    pre_scripts: CollectionProperty(type=CDI_ConfigEntry)
+    post_scripts: CollectionProperty(type=CDI_ConfigEntry)
+    foreach_pre_scripts: CollectionProperty(type=CDI_ConfigEntry)
+    foreach_post_scripts: CollectionProperty(type=CDI_ConfigEntry)
+    pre_script: joined_property('pre_scripts', name='Pre Script', description='Before Import All Files')
+    post_script: joined_property('post_scripts', name='Post Script', description='After Import All Files')
+    foreach_pre_script: joined_property('foreach_pre_scripts', name='Foreach Pre Script',
+                                        description='Before Import Each File')
+    foreach_post_script: joined_property('foreach_post_scripts', name='Foreach Post Script',
+                                         description='After Import Each File')
     operator_context: EnumProperty(default='EXEC_DEFAULT', name='Context',
-                                   items=[(k, k.replace('_', ' ').title(), '') for k in operator_context])
+                                   items=[(k, k.replace('_', ' ').title(), '') for k in operator_context],
+                                   update=update_config_item)
+    batch_import: BoolProperty(name='Batch Import',
+                               description='Import all files with a single operator call '
+                                           'if the operator accepts a directory and files', update=update_config_item)
+    parallel_import: BoolProperty(name='Parallel Import',
+                                  description='Import files in background Blender processes and append the results '
+                                              '(3D View only, operators that need a window import in process)', update=update_config_item)
+    dedup_import: BoolProperty(name='Reuse Imported',
+                               description='Create linked duplicates when a file with the same content '
+                                           'was already imported in this session', update=update_config_item)
+    no_undo: BoolProperty(name='No Undo',
+                          description='Do not record undo for this import, saves memory on huge batches', update=update_config_item)
+    queued_import: BoolProperty(name='Queued Import',
+                                description='Import in the background a few files at a time, '
+                                            'with a progress bar and Esc to cancel', update=update_config_item)
     # display
-    category: StringProperty(default='default')
+    category: StringProperty(default='default', update=update_config_item)
+    loaded_category: StringProperty()  # category file the item was loaded / saved in, not saved
+    selected: BoolProperty(name='Select', description='Select for editing several configs at once')  # not saved
+
+
+# collections of a config: the ';' joined key they are saved as
+C_LIST_KEYS = {
+    'extensions': 'bl_file_extensions',
+    'pre_scripts': 'pre_script',
+    'post_scripts': 'post_script',
+    'foreach_pre_scripts': 'foreach_pre_script',
+    'foreach_post_scripts': 'foreach_post_script',
+}
+# state of the list, not saved in the config files
+C_ITEM_ONLY_KEYS = ('category', 'loaded_category', 'selected')
+# bool options of a config, filled in bulk when loading
+C_BOOL_KEYS = ('batch_import', 'parallel_import', 'dedup_import', 'no_undo', 'queued_import')
 
 
 def load_config_wm() -> dict[str, dict[str, dict[str, str]]]:
-    """load config from json file to window manager
+    """load config from the config repository to window manager
     :return: category data
     {'filename': {'label': {'key': 'value'}}}
     """
-    import json
-    cat_datas = {}  # category only use in display
-    for file in get_AssetDir_path(AssetDir.CONFIG).iterdir():
-        with open(file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            cat_datas.update({file.stem: data})
-    if not cat_datas:
-        # create a new json file
-        with open(get_AssetDir_path(AssetDir.CONFIG) / 'default.json', 'w', encoding='utf-8') as f:
-            cat_datas['default'] = {'New Importer': {'bl_import_operator': '', 'bl_file_extensions': '.txt',
-                                                     'poll_area': 'VIEW_3D', 'operator_context': 'EXEC_DEFAULT'}}
+    try:
+        with suppress_dirty():
+            return _load_config_wm()
+    finally:
+        G_dirty_categories.clear()
+
+
+def _load_config_wm() -> dict[str, dict[str, dict[str, str]]]:
+    G_config_repo.ensure_default()
+    cat_datas = G_config_repo.categories()  # category only use in display
+    rows = G_config_repo.rows()
+    config_list = bpy.context.window_manager.cdi_config_list
     # clear all item
-    bpy.context.window_manager.cdi_config_list.clear()
-
-    for category, datas in cat_datas.items():
-        for label, values in datas.items():
-            item = bpy.context.window_manager.cdi_config_list.add()
-            item.name = label
-            for k, v in values.items():
-                setattr(item, k, v)
-            setattr(item, category, category)
+    config_list.clear()
+    G_config_filter.mark_dirty()
+
+    for category, label, values in rows:
+        item = config_list.add()
+        item.name = label
+        item.category = category
+        item.loaded_category = category
+        for k, v in values.items():
+            if k in C_BOOL_KEYS or k in C_ITEM_ONLY_KEYS: continue  # the category is the file name
+            setattr(item, k, v)
+    # bool options in one call each
+    for k in C_BOOL_KEYS:
+        if any(k in values for _, _, values in rows):
+            config_list.foreach_set(k, [bool(values.get(k, False)) for _, _, values in rows])
 
     return cat_datas
 
 
-def save_config_wm() -> None:
-    import json
-    cat_datas = {}
+def save_config_wm() -> dict[str, int]:
+    """save the edited categories from window manager to json files, then update the registered operators
+    :return: registration counts, see _runtime.ensure_op_handles, and the count of written category files
+    """
+    if not G_dirty_categories:
+        return {'added': 0, 'removed': 0, 'changed': 0, 'classes': 0, 'files': 0}
+
+    # a category left without item is written empty
+    cat_datas = {category: {} for category in G_dirty_categories}
+    saved_items = []
     for item in bpy.context.window_manager.cdi_config_list:
-        if item.category not in cat_datas:
-            cat_datas[item.category] = {}
-        save_dict = dict(item.items())
+        if item.category not in cat_datas: continue
+        # collections are saved as ';' joined strings, in place to keep the key order of the file
+        save_dict = {C_LIST_KEYS.get(k, k): getattr(item, C_LIST_KEYS[k]) if k in C_LIST_KEYS else v
+                     for k, v in item.items()}
         # process saving
         save_dict.pop('name')  # remove name
+        for k in C_ITEM_ONLY_KEYS:
+            save_dict.pop(k, None)
         save_dict['bl_import_operator'] = item.bl_import_operator  # empty need to save manually
+        save_dict['bl_file_extensions'] = item.bl_file_extensions  # the same as above
         save_dict['poll_area'] = item.poll_area  # EnumProperty save index instead of string, so handle here
         save_dict['operator_context'] = item.operator_context  # the same as above
         for st in scripts_types:
-            if item.get(st) == '': save_dict.pop(st)  # remove empty script
+            if save_dict.get(st) == '': save_dict.pop(st)  # remove empty script
+        for k in C_BOOL_KEYS:
+            if save_dict.pop(k, False): save_dict[k] = True  # only save enabled options, as json bool
         cat_datas[item.category].update({item.name: save_dict})
+        saved_items.append(item)
     # save in file
     for category, datas in cat_datas.items():
-        with open(get_AssetDir_path(AssetDir.CONFIG) / f'{category}.json', 'w', encoding='utf-8') as f:
-            json.dump(datas, f, indent=4, allow_nan=True)
+        G_config_repo.save_category(category, datas)
+    G_config_repo.save_snapshot()
+
+    with suppress_dirty():
+        for item in saved_items:
+            item.loaded_category = item.category
+    G_dirty_categories.clear()
 
-    load_config_wm()
     from . import _runtime
-    _runtime.unregister()
-    _runtime.register()
+    counts = _runtime.ensure_op_handles()
+    counts['files'] = len(cat_datas)
+    return counts
 
 
 class CDI_OT_config_sl(bpy.types.Operator):
@@ -87,10 +229,16 @@ class CDI_OT_config_sl(bpy.types.Operator):
 
     def execute(self, context):
         if self.type == 'SAVE':
-            save_config_wm()
+            counts = save_config_wm()
+            if not counts['files']:
+                self.report({'INFO'}, 'Save config: nothing changed')
+                return {"FINISHED"}
+            self.report({'INFO'}, f"Save config: {counts['files']} files, {counts['added']} added, "
+                                  f"{counts['removed']} removed, {counts['changed']} changed, "
+                                  f"{counts['classes']} classes registered")
         else:
             load_config_wm()
-        self.report({'INFO'}, f'{self.type.title()} config')
+            self.report({'INFO'}, 'Load config')
         return {"FINISHED"}
 
     def invoke(self, context, event):
@@ -100,34 +248,31 @@ class CDI_OT_config_sl(bpy.types.Operator):
 class CDI_UL_ConfigList(bpy.types.UIList):
 
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        from ._runtime import G_op_errors
         row = layout.row()
 
+        row.prop(item, 'selected', text='')
         row.prop(item, 'name', text='', emboss=False)
         row.label(text=item.bl_file_extensions)
         row.label(text=area_type.get(item.poll_area, item.poll_area))
 
-        show_script = False
-        for st in scripts_types:
-            if getattr(item, st) != '':
-                show_script = True
-                break
-
-        row.label(text='', icon='FILE_SCRIPT' if show_script else "DOT")
+        row.label(text='', icon='FILE_SCRIPT' if G_config_filter.has_script(index) else "DOT")
+        if item.name in G_op_errors:
+            row.label(text='', icon='ERROR')
 
     def filter_items(self, context, data, propname):
         items = getattr(data, propname)
+        # rows are copied again only after an edit
+        if G_config_filter.dirty or len(G_config_filter) != len(items):
+            G_config_filter.rebuild((item.category, item.name, item.bl_file_extensions, item.bl_import_operator,
+                                     any(len(getattr(item, st + 's')) for st in scripts_types)) for item in items)
+
+        # search name / extensions / operator in the category
+        filtered = G_config_filter.filter(context.window_manager.cdi_config_category, self.filter_name,
+                                          self.bitflag_filter_item)
         ordered = []
-        filtered = [self.bitflag_filter_item] * len(items)
-
-        for i, item in enumerate(items):
-            if item.category != context.window_manager.cdi_config_category:
-                filtered[i] &= ~self.bitflag_filter_item
-
-        try:
-            ordered = bpy.types.UI_UL_list.sort_items_helper(items,
-                                                             lambda i: len(getattr(i, filter.filter_type[7:]), True))
-        except:
-            pass
+        if self.use_filter_sort_alpha:
+            ordered = G_config_filter.order(bpy.types.UI_UL_list.sort_items_helper)
 
         return filtered, ordered
 
@@ -155,17 +300,14 @@ class CDI_OT_configlist_edit(bpy.types.Operator):
         wm = context.window_manager
         if self.operator_type == 'ADD':
             new_item = wm.cdi_config_list.add()
+            new_item.category = wm.cdi_config_category  # first, the updates below mark it dirty
             new_item.name = f'Config{len(wm.cdi_config_list)}'
-            # correct index
-            old_index = wm.cdi_config_list_index
-            new_index = len(wm.cdi_config_list) - 1
-            wm.cdi_config_list_index = new_index
-
-            for i in range(old_index, new_index - 1):
-                bpy.ops.cdi.configlist_edit(operator_type='MOVE_UP')
+            new_item.bl_file_extensions = '.txt'
+            self.insert_after_active(context)
 
         elif self.operator_type == 'REMOVE':
             index = wm.cdi_config_list_index
+            mark_category_dirty(wm.cdi_config_list[index])  # written without the item
             wm.cdi_config_list.remove(index)
             wm.cdi_config_list_index = index - 1 if index != 0 else 0
 
@@ -174,6 +316,7 @@ class CDI_OT_configlist_edit(bpy.types.Operator):
             index = wm.cdi_config_list_index
             neighbor = index + (-1 if self.operator_type == 'MOVE_UP' else 1)
             my_list.move(neighbor, index)
+            mark_category_dirty(my_list[index])  # the order of the file changed
             self.move_index(context)
 
         elif self.operator_type == 'COPY':
@@ -181,20 +324,28 @@ class CDI_OT_configlist_edit(bpy.types.Operator):
 
             new_item = wm.cdi_config_list.add()
 
-            for key in src_item.__annotations__.keys():
-                value = getattr(src_item, key)
-                if key == 'name': value = f'{value}_copy'
-                setattr(new_item, key, value)
-
-            old_index = wm.cdi_config_list_index
-            new_index = len(wm.cdi_config_list) - 1
-            wm.cdi_config_list_index = len(wm.cdi_config_list) - 1
+            with suppress_dirty():
+                for key in src_item.__annotations__.keys():
+                    if key in C_LIST_KEYS: continue  # copied with the joined strings
+                    if key in ('loaded_category', 'selected'): continue
+                    value = getattr(src_item, key)
+                    if key == 'name': value = f'{value}_copy'
+                    setattr(new_item, key, value)
+            mark_category_dirty(new_item)  # once, with its category set
 
-            for i in range(old_index, new_index - 1):
-                bpy.ops.cdi.configlist_edit(operator_type='MOVE_UP')
+            self.insert_after_active(context)
 
+        G_config_filter.mark_dirty()  # indexes changed
         return {'FINISHED'}
 
+    def insert_after_active(self, context):
+        """move the item added at the end below the active one, in one collection move"""
+        wm = context.window_manager
+        new_index = len(wm.cdi_config_list) - 1
+        index = min(wm.cdi_config_list_index + 1, new_index)
+        wm.cdi_config_list.move(new_index, index)
+        wm.cdi_config_list_index = index
+
     def move_index(self, context):
         wm = context.window_manager
         index = wm.cdi_config_list_index
@@ -207,32 +358,38 @@ class CDI_OT_script_selector(bpy.types.Operator):
     bl_label = 'Select Script'
     bl_property = 'enum_script'
 
-    _enum_script = []  # store
+    # (phase, locale): (script listing, enum items), keep a reference, blender does not copy enum strings
+    _enum_script = {}
 
     operator_type: EnumProperty(
         items=[('ADD', 'Add', ''), ('REMOVE', 'Remove', '')], options={'SKIP_SAVE', 'HIDDEN'})
 
     scripts_types: StringProperty()
-    remove_script: StringProperty()
+    index: IntProperty(options={'SKIP_SAVE'})  # of the script to remove
 
     def get_script(self, context):
         from bpy.app.translations import pgettext_iface as _p
-        enum_items = CDI_OT_script_selector._enum_script
-        enum_items.clear()
-        # for file in get_ScriptDir().iterdir():
-        #     enum_items.append((file.name, file.stem, ''))
-
-        # enum_item ( file.name, file.name - file directory, '')
-        for root, dirs, files in os.walk(get_ScriptDir()):
-            for file in files:
-                directory = root.split(os.sep)[-1]
-                if directory == 'scripts':
-                    enum_items.append((file, file, ''))
-                else:
-                    directory = directory.removesuffix('_script')
-                    directory = directory.replace('_', ' ').title()
-                    enum_items.append((file, f'{_p(directory)}: {file}', ''))
+        # only the scripts supporting the phase being edited
+        scripts = G_script_index.scripts(self.scripts_types)
+        key = (self.scripts_types, bpy.app.translations.locale)
+        cached = CDI_OT_script_selector._enum_script.get(key)
+        if cached is not None and cached[0] is scripts:
+            return cached[1]
+
+        # enum_item ( file.name, file.name - file directory, docstring - path)
+        enum_items = []
+        for file, path, doc in scripts:
+            desc = f'{doc}\n{path}' if doc else str(path)
+            if file in G_script_index.conflicts:
+                desc += ' ' + _p('(Duplicate name)')
+            if path.parent == G_script_index.root:
+                enum_items.append((file, file, desc))
+            else:
+                directory = path.parent.name.removesuffix('_script')
+                directory = directory.replace('_', ' ').title()
+                enum_items.append((file, f'{_p(directory)}: {file}', desc))
 
+        CDI_OT_script_selector._enum_script[key] = (scripts, enum_items)
         return enum_items
 
     enum_script: EnumProperty(
@@ -244,18 +401,13 @@ class CDI_OT_script_selector(bpy.types.Operator):
         wm = context.window_manager
         item = wm.cdi_config_list[wm.cdi_config_list_index]
         if self.scripts_types in scripts_types:
-            # setattr(item, self.scripts_types, self.enum_script)
-
-            scripts_list = getattr(item, self.scripts_types)
+            scripts = getattr(item, self.scripts_types + 's')
             if self.operator_type == 'REMOVE':
-                ori_list = scripts_list.split(';')
-                ori_list.remove(self.remove_script)
-                setattr(item, self.scripts_types, ';'.join(ori_list))
+                if self.index < len(scripts): scripts.remove(self.index)
             else:
-                setattr(item, self.scripts_types, scripts_list + ';' + self.enum_script)
-
-            if getattr(item, self.scripts_types).startswith(';'):
-                setattr(item, self.scripts_types, getattr(item, self.scripts_types)[1:])
+                scripts.add().name = self.enum_script
+            G_config_filter.mark_dirty()
+            mark_category_dirty(item)
 
         context.area.tag_redraw()
 
@@ -269,40 +421,61 @@ class CDI_OT_script_selector(bpy.types.Operator):
             return self.execute(context)
 
 
-class CDI_OT_idname_selector(bpy.types.Operator):
-    bl_idname = 'cdi.idname_selector'
-    bl_label = 'Select Operator'
-    bl_property = 'enum_idname'
+# operator properties of an import operator, ranked first in the operator selector
+C_IMPORT_PROPS = {'filepath', 'files', 'directory'}
 
-    _enum_idname = []  # store
 
-    def get_idname(self, context):
-        enum_items = CDI_OT_idname_selector._enum_idname
-        enum_items.clear()
-
-        def get_op_label(bl_idname: str):
-            opid = bl_idname.split(".")
-            opmod = getattr(bpy.ops, opid[0])
-            op = getattr(opmod, opid[1])
-            label = op.get_rna_type().bl_rna.name
-            return label
-
-        name_ops = {}
-        opsdir = dir(bpy.ops)
-        for opmodname in opsdir:
+class OperatorCatalog():
+    """enum items of all operators, built once and again only when the enabled addons change"""
+
+    def __init__(self):
+        self._items: list[tuple[str, str, str]] = []  # keep a reference, blender does not copy enum strings
+        self._fingerprint = None
+
+    @staticmethod
+    def fingerprint() -> tuple:
+        return tuple(bpy.context.preferences.addons.keys()), len(dir(bpy.ops))
+
+    def build(self) -> list[tuple[str, str, str]]:
+        ops = []
+        for opmodname in dir(bpy.ops):
             opmod = getattr(bpy.ops, opmodname)
-            opmoddir = dir(opmod)
-            for o in opmoddir:
+            for o in dir(opmod):
                 bl_idname = opmodname + "." + o
-                label = get_op_label(bl_idname)
+                try:
+                    rna = getattr(opmod, o).get_rna_type()
+                except (AttributeError, KeyError, RuntimeError):
+                    continue
+                label = rna.bl_rna.name
                 if bl_idname == label: continue  # pass the unnecessary operator
-                name_ops[label] = bl_idname
+                is_import = not C_IMPORT_PROPS.isdisjoint(prop.identifier for prop in rna.properties)
+                ops.append((not is_import, label, bl_idname))
+        # import operators first, then by label
+        ops.sort()
+        return [(bl_idname, label, bl_idname) for _, label, bl_idname in ops]
 
-        # sort by bl_idname
-        sort_ops = sorted(name_ops.items(), key=lambda x: x[0])
-        enum_items = [(bl_idname, label, "") for label, bl_idname in sort_ops]
-        print(enum_items)
-        return enum_items
+    def items(self) -> list[tuple[str, str, str]]:
+        fingerprint = self.fingerprint()
+        if fingerprint != self._fingerprint:
+            self._items = self.build()
+            self._fingerprint = fingerprint
+        return self._items
+
+    def invalidate(self):
+        self._items = []
+        self._fingerprint = None
+
+
+G_op_catalog = OperatorCatalog()
+
+
+class CDI_OT_idname_selector(bpy.types.Operator):
+    bl_idname = 'cdi.idname_selector'
+    bl_label = 'Select Operator'
+    bl_property = 'enum_idname'
+
+    def get_idname(self, context):
+        return G_op_catalog.items()
 
     enum_idname: EnumProperty(
         name="Operators",
@@ -329,21 +502,21 @@ class CDI_OT_file_ext_editor(bpy.types.Operator):
         items=[('ADD', 'Add', ''), ('REMOVE', 'Remove', '')], options={'SKIP_SAVE', 'HIDDEN'})
 
     ext: StringProperty(name='New', options={'SKIP_SAVE'})
+    index: IntProperty(options={'SKIP_SAVE'})  # of the extension to remove
 
     def execute(self, context):
         item = context.window_manager.cdi_config_list[context.window_manager.cdi_config_list_index]
         if self.operator_type == 'REMOVE':
-            ori_list = item.bl_file_extensions.split(';')
-            ori_list.remove(self.ext)
-            item.bl_file_extensions = ';'.join(ori_list)
-            if item.bl_file_extensions.startswith(';'):
-                item.bl_file_extensions = item.bl_file_extensions[1:]
+            if self.index < len(item.extensions): item.extensions.remove(self.index)
         else:
-            if not self.ext.startswith('.'):
-                self.ext = '.' + self.ext
-            item.bl_file_extensions += ';' + self.ext
-            if item.bl_file_extensions.startswith(';'):
-                item.bl_file_extensions = item.bl_file_extensions[1:]
+            ext = normalize_ext(self.ext)
+            if not ext: return {'CANCELLED'}
+            if ext in (entry.name for entry in item.extensions):
+                self.report({'WARNING'}, f'{ext} already added')
+                return {'CANCELLED'}
+            item.extensions.add().name = ext
+        G_config_filter.mark_dirty()
+        mark_category_dirty(item)
 
         context.area.tag_redraw()
         return {'FINISHED'}
@@ -355,6 +528,139 @@ class CDI_OT_file_ext_editor(bpy.types.Operator):
             return self.execute(context)
 
 
+# bulk operation: properties asked in its dialog
+C_BULK_PROPS = {
+    'SET_AREA': ('poll_area',),
+    'SET_CONTEXT': ('operator_context',),
+    'ADD_EXT': ('ext',),
+    'REMOVE_EXT': ('ext',),
+    'ADD_SCRIPT': ('scripts_types', 'enum_script'),
+    'MOVE_CATEGORY': ('category',),
+}
+
+
+class CDI_OT_configlist_bulk(bpy.types.Operator):
+    """Edit the selected configs of the category at once"""
+    bl_idname = 'cdi.configlist_bulk'
+    bl_label = 'Edit Selected'
+
+    operator_type: EnumProperty(
+        name='Edit Selected',
+        items=[
+            ('SELECT_ALL', 'Select All', ''),
+            ('DESELECT_ALL', 'Deselect All', ''),
+            ('SET_AREA', 'Set Area', ''),
+            ('SET_CONTEXT', 'Set Context', ''),
+            ('ADD_EXT', 'Add File Extension', ''),
+            ('REMOVE_EXT', 'Remove File Extension', ''),
+            ('ADD_SCRIPT', 'Add Script', ''),
+            ('MOVE_CATEGORY', 'Move To Category', ''),
+            ('REMOVE', 'Remove', ''),
+        ], options={'SKIP_SAVE'})
+
+    poll_area: EnumProperty(name='Area', items=[(k, v, '') for k, v in area_type.items()])
+    operator_context: EnumProperty(name='Context',
+                                   items=[(k, k.replace('_', ' ').title(), '') for k in operator_context])
+    ext: StringProperty(name='File Extension')
+    scripts_types: EnumProperty(name='Phase', items=[(st, st.replace('_', ' ').title(), '') for st in scripts_types])
+    enum_script: EnumProperty(name='Script', items=CDI_OT_script_selector.get_script)
+    category: StringProperty(name='Category', description='Config file of the category, created when saving')
+
+    def selected_indexes(self, context) -> list[int]:
+        wm = context.window_manager
+        config_list = wm.cdi_config_list
+        selected = [False] * len(config_list)
+        config_list.foreach_get('selected', selected)
+        return [i for i, flag in enumerate(selected) if flag and config_list[i].category == wm.cdi_config_category]
+
+    def execute(self, context):
+        wm = context.window_manager
+        config_list = wm.cdi_config_list
+
+        if self.operator_type in {'SELECT_ALL', 'DESELECT_ALL'}:
+            select = self.operator_type == 'SELECT_ALL'
+            selected = [False] * len(config_list)
+            config_list.foreach_get('selected', selected)
+            config_list.foreach_set('selected', [select if item.category == wm.cdi_config_category else flag
+                                                 for item, flag in zip(config_list, selected)])
+            context.area.tag_redraw()
+            return {'FINISHED'}
+
+        indexes = self.selected_indexes(context)
+        if not indexes:
+            self.report({'WARNING'}, 'No config selected')
+            return {'CANCELLED'}
+        items = [config_list[i] for i in indexes]
+
+        ext = normalize_ext(self.ext)
+        category = self.category.strip()
+        if self.operator_type in {'ADD_EXT', 'REMOVE_EXT'} and not ext:
+            return {'CANCELLED'}
+        if self.operator_type == 'MOVE_CATEGORY' and (not category or any(c in category for c in '/\\:')):
+            self.report({'ERROR'}, f'Invalid category name: {self.category}')
+            return {'CANCELLED'}
+        if self.operator_type == 'ADD_SCRIPT' and not self.enum_script:
+            return {'CANCELLED'}
+        if self.operator_type == 'MOVE_CATEGORY':
+            # a category file holds one config per label
+            moving = set(indexes)
+            existing = {item.name for i, item in enumerate(config_list) if item.category == category and i not in moving}
+            if same := sorted(existing.intersection(item.name for item in items)):
+                self.report({'WARNING'}, f'{category} already has {", ".join(same)}, rename them before moving')
+                return {'CANCELLED'}
+
+        # the categories are marked once, saving writes each file once and updates the operators in one diff
+        for item in items:
+            mark_category_dirty(item)
+        with suppress_dirty():
+            if self.operator_type == 'SET_AREA':
+                for item in items:
+                    item.poll_area = self.poll_area
+            elif self.operator_type == 'SET_CONTEXT':
+                for item in items:
+                    item.operator_context = self.operator_context
+            elif self.operator_type == 'ADD_EXT':
+                for item in items:
+                    if ext not in (entry.name for entry in item.extensions):
+                        item.extensions.add().name = ext
+            elif self.operator_type == 'REMOVE_EXT':
+                for item in items:
+                    names = [entry.name for entry in item.extensions]
+                    if ext in names: item.extensions.remove(names.index(ext))
+            elif self.operator_type == 'ADD_SCRIPT':
+                for item in items:
+                    scripts = getattr(item, self.scripts_types + 's')
+                    if self.enum_script not in (entry.name for entry in scripts):
+                        scripts.add().name = self.enum_script
+            elif self.operator_type == 'MOVE_CATEGORY':
+                G_dirty_categories.add(category)
+                for item in items:
+                    item.category = category
+                wm.cdi_config_category = category  # keep showing the moved configs
+            elif self.operator_type == 'REMOVE':
+                for index in reversed(indexes):
+                    config_list.remove(index)
+                wm.cdi_config_list_index = max(0, min(wm.cdi_config_list_index, len(config_list) - 1))
+
+        G_config_filter.mark_dirty()
+        self.report({'INFO'}, f'{len(items)} configs edited, save to apply')
+        context.area.tag_redraw()
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        if self.operator_type == 'REMOVE':
+            return context.window_manager.invoke_confirm(self, event)
+        if self.operator_type not in C_BULK_PROPS:
+            return self.execute(context)
+        if self.operator_type == 'MOVE_CATEGORY' and not self.category:
+            self.category = context.window_manager.cdi_config_category
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        for prop in C_BULK_PROPS.get(self.operator_type, ()):
+            self.layout.prop(self, prop)
+
+
 def draw_layout(self, context, layout):
     wm = context.window_manager
 
@@ -381,6 +687,8 @@ def draw_layout(self, context, layout):
     col.operator(CDI_OT_configlist_edit.bl_idname, icon='TRIA_DOWN', text='').operator_type = 'MOVE_DOWN'
     col.separator()
     col.operator(CDI_OT_configlist_edit.bl_idname, icon='COPYDOWN', text='').operator_type = 'COPY'
+    col.separator()
+    col.operator_menu_enum(CDI_OT_configlist_bulk.bl_idname, 'operator_type', icon='DOWNARROW_HLT', text='')
 
     row.template_list(
         "CDI_UL_ConfigList", "Config List",
@@ -396,17 +704,18 @@ def draw_layout(self, context, layout):
         row = box.row(align=True)
         row.prop(item, 'bl_import_operator')
         row.operator('CDI_OT_idname_selector', icon='VIEWZOOM', text='')
+        from ._runtime import G_op_errors
+        if error := G_op_errors.get(item.name):
+            box.label(text=error, icon='ERROR')
         ################
         # box.prop(item, 'bl_file_extensions')
         row = box.split(factor=0.5)
         row.label(text='File Extensions')
-        if ext_list := item.bl_file_extensions.split(';'):
-            ext_list = [ext for ext in ext_list if ext != '']
-            for ext in ext_list:
-                row = row.row()
-                op = row.operator('CDI_OT_file_ext_editor', text=ext, icon='X')
-                op.ext = ext
-                op.operator_type = 'REMOVE'
+        for i, entry in enumerate(item.extensions):
+            row = row.row()
+            op = row.operator('CDI_OT_file_ext_editor', text=entry.name, icon='X')
+            op.index = i
+            op.operator_type = 'REMOVE'
 
         row = row.row()
         op = row.operator('CDI_OT_file_ext_editor', icon='ADD', text='')
@@ -414,6 +723,11 @@ def draw_layout(self, context, layout):
 
         box.prop(item, 'poll_area')
         box.prop(item, 'operator_context')
+        box.prop(item, 'batch_import')
+        box.prop(item, 'parallel_import')
+        box.prop(item, 'dedup_import')
+        box.prop(item, 'no_undo')
+        box.prop(item, 'queued_import')
         ################
         box = box.box()
         box.use_property_split = False
@@ -425,25 +739,95 @@ def draw_layout(self, context, layout):
                 row = box.row()
                 row.label(text=st.replace('_', ' ').title())
 
-                if script_list := getattr(item, st).split(';'):
-                    script_list = [s for s in script_list if s != '']
-                    for script in script_list:
-                        op = row.operator(CDI_OT_script_selector.bl_idname, icon='X', text=script)
-                        op.scripts_types = st
-                        op.operator_type = 'REMOVE'
-                        op.remove_script = script
+                for i, entry in enumerate(getattr(item, st + 's')):
+                    op = row.operator(CDI_OT_script_selector.bl_idname, icon='X', text=entry.name)
+                    op.scripts_types = st
+                    op.operator_type = 'REMOVE'
+                    op.index = i
 
                 op = row.operator(CDI_OT_script_selector.bl_idname, icon='ADD', text='')
                 op.scripts_types = st
                 op.operator_type = "ADD"
 
 
+class CDI_OT_import_report_dump(bpy.types.Operator):
+    bl_idname = 'cdi.import_report_dump'
+    bl_label = 'Dump Import Reports'
+    bl_description = 'Save recorded import reports as json lines'
+
+    filepath: StringProperty(subtype='FILE_PATH', default='cdi_import_report.jsonl')
+
+    def execute(self, context):
+        from .import_report import dump_reports
+        count = dump_reports(self.filepath)
+        self.report({'INFO'}, f'Saved {count} reports')
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+def draw_import_report(self, context, layout):
+    from .import_report import get_reports
+
+    box = layout.box()
+    box.label(text='Last Import', icon='TIME')
+    row = box.row(align=True)
+    row.prop(self, 'enable_import_report')
+    row.prop(self, 'import_report_size')
+
+    reports = get_reports()
+    if not reports:
+        box.label(text='No import recorded')
+        return
+
+    report = reports[-1]
+    col = box.column(align=True)
+    col.label(text=f"{report['label']} ({report['operator']}): "
+                   f"{len(report['files'])} files, {report['total'] * 1000:.1f} ms")
+    for name, seconds in report['phases'].items():
+        row = col.split(factor=0.5)
+        row.label(text=name.replace('_', ' ').title())
+        row.label(text=f'{seconds * 1000:.1f} ms')
+
+    col = box.column(align=True)
+    for file in sorted(report['files'], key=lambda f: f['seconds'], reverse=True)[:5]:
+        row = col.split(factor=0.5)
+        row.label(text=os.path.basename(file['file']), icon='FILE')
+        row.label(text=f"{file['seconds'] * 1000:.1f} ms, {file['size'] / 1024:.0f} KB, "
+                       f"{file['datablocks']} datablocks")
+
+    box.operator(CDI_OT_import_report_dump.bl_idname, icon='EXPORT')
+
+
 def refresh_keymap(self, context):
     from . import keymap
     keymap.unregister()
     keymap.register()
 
 
+def update_report_size(self, context):
+    from .import_report import set_history_size
+    set_history_size(self.import_report_size)
+
+
+def update_lazy_register(self, context):
+    if self.lazy_register: return
+    from . import _runtime
+    for label in list(_runtime.G_configs):
+        _runtime.materialize_op(label)
+
+
+def update_watch_files(self, context):
+    from .hot_reload import set_watch
+    set_watch(self.watch_files)
+
+
+def get_pref() -> 'CDI_Preference':
+    return bpy.context.preferences.addons[__package__].preferences
+
+
 class CDI_Preference(bpy.types.AddonPreferences):
     bl_idname = __package__
 
@@ -458,6 +842,17 @@ class CDI_Preference(bpy.types.AddonPreferences):
                                        ('1', 'Ctrl Alt LeftMouse Drag', '')
                                    ], update=refresh_keymap, default='1'
                                    )
+    parallel_workers: IntProperty(name='Parallel Import Workers', default=4, min=1, soft_max=16)
+    parallel_timeout: FloatProperty(name='Timeout Per File', description='Seconds before a worker is killed',
+                                    default=300, min=1)
+    enable_import_report: BoolProperty(name='Record Imports', description='Record timings of each drop import')
+    import_report_size: IntProperty(name='History', default=10, min=1, soft_max=100, update=update_report_size)
+    lazy_register: BoolProperty(name='Lazy Register',
+                                description='Register import operators on first drop instead of at startup',
+                                update=update_lazy_register)
+    watch_files: BoolProperty(name='Reload On Change',
+                              description='Watch the config and script folders, reload changed files automatically',
+                              update=update_watch_files)
 
     def draw(self, context):
         layout = self.layout
@@ -468,38 +863,51 @@ class CDI_Preference(bpy.types.AddonPreferences):
             draw_layout(self, context, layout)
         else:
             layout.prop(self, 'clipboard_keymap')
+            layout.prop(self, 'lazy_register')
+            layout.prop(self, 'watch_files')
+            col = layout.column()
+            col.prop(self, 'parallel_workers')
+            col.prop(self, 'parallel_timeout')
+            draw_import_report(self, context, layout)
 
 
 def register():
+    bpy.utils.register_class(CDI_ConfigEntry)
     bpy.utils.register_class(CDI_ConfigItem)
     bpy.utils.register_class(CDI_UL_ConfigList)
     bpy.utils.register_class(CDI_OT_config_sl)
     bpy.utils.register_class(CDI_OT_script_selector)
     bpy.utils.register_class(CDI_OT_idname_selector)
     bpy.utils.register_class(CDI_OT_configlist_edit)
+    bpy.utils.register_class(CDI_OT_configlist_bulk)
     bpy.utils.register_class(CDI_OT_file_ext_editor)
+    bpy.utils.register_class(CDI_OT_import_report_dump)
     bpy.utils.register_class(CDI_Preference)
 
     bpy.types.WindowManager.cdi_config_list = CollectionProperty(type=CDI_ConfigItem)
     bpy.types.WindowManager.cdi_config_list_index = IntProperty()
     bpy.types.WindowManager.cdi_config_show_advanced = BoolProperty(default=False, name='Advanced')
 
-    cats = load_config_wm().keys()
+    load_config_wm()
 
-    bpy.types.WindowManager.cdi_config_category = EnumProperty(items=[(c, c, '') for c in cats], name='Category')
+    bpy.types.WindowManager.cdi_config_category = EnumProperty(items=get_config_categories, name='Category')
 
 
 def unregister():
     bpy.utils.unregister_class(CDI_ConfigItem)
+    bpy.utils.unregister_class(CDI_ConfigEntry)
     bpy.utils.unregister_class(CDI_UL_ConfigList)
     bpy.utils.unregister_class(CDI_OT_config_sl)
     bpy.utils.unregister_class(CDI_OT_script_selector)
     bpy.utils.unregister_class(CDI_OT_idname_selector)
     bpy.utils.unregister_class(CDI_OT_configlist_edit)
+    bpy.utils.unregister_class(CDI_OT_configlist_bulk)
     bpy.utils.unregister_class(CDI_OT_file_ext_editor)
+    bpy.utils.unregister_class(CDI_OT_import_report_dump)
     bpy.utils.unregister_class(CDI_Preference)
 
     del bpy.types.WindowManager.cdi_config_show_advanced
     del bpy.types.WindowManager.cdi_config_category
     del bpy.types.WindowManager.cdi_config_list
     del bpy.types.WindowManager.cdi_config_list_index
+    G_op_catalog.invalidate()
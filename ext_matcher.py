@@ -0,0 +1,87 @@
+from collections import Counter
+from pathlib import Path
+
+
+def split_extensions(ext_str: str) -> list[str]:
+    """split ';' joined extensions into normalized ones: lower case, start with '.', no duplicates"""
+    exts = []
+    for ext in ext_str.split(';'):
+        ext = ext.strip().lower()
+        if not ext: continue
+        if not ext.startswith('.'): ext = '.' + ext
+        if ext not in exts: exts.append(ext)
+    return exts
+
+
+def iter_suffixes(filename: str, max_dots: int):
+    """yield the lower case dotted suffixes of a file name, shortest first: '.gz', '.tar.gz'"""
+    name = filename.lower()
+    pos = len(name)
+    for _ in range(max_dots):
+        pos = name.rfind('.', 0, pos)
+        if pos < 0: return
+        yield name[pos:]
+
+
+def most_common_suffix(paths: list[Path]) -> list[Path]:
+    """keep the paths with the most common case-insensitive extension, in a single counting pass"""
+    exts = [path.suffix.lower() for path in paths]
+    if not exts: return []
+    ext = Counter(exts).most_common(1)[0][0]
+    return [path for path, path_ext in zip(paths, exts) if path_ext == ext]
+
+
+class ExtensionIndex():
+    """(area, extension) -> operator idnames, rebuilt when configs are registered"""
+
+    def __init__(self):
+        self._index: dict[tuple[str, str], list[str]] = {}
+        self._max_dots = 0
+
+    def build(self, entries):
+        """
+        :param entries: iterable of (area, ExtensionMatcher, operator idname), in registration order
+        """
+        index = {}
+        max_dots = 0
+        for area, matcher, bl_idname in entries:
+            for ext in matcher.exts:
+                index.setdefault((area, ext), []).append(bl_idname)
+                max_dots = max(max_dots, ext.count('.'))
+        self._index = index
+        self._max_dots = max_dots
+
+    def find(self, area: str, filename: str) -> list[str]:
+        ops = []
+        for suffix in iter_suffixes(filename, self._max_dots):
+            for bl_idname in self._index.get((area, suffix), ()):
+                if bl_idname not in ops: ops.append(bl_idname)
+        return ops
+
+
+class ExtensionMatcher():
+    """
+    Case-insensitive file extension lookup compiled once from a ';' joined string.
+    Compound suffixes like '.tar.gz' are supported, a file name is checked against its last n dotted suffixes
+    where n is the most dots of the configured extensions, so matching does not depend on the extension count.
+    """
+    __slots__ = ('exts', '_max_dots')
+
+    def __init__(self, ext_str: str):
+        self.exts = frozenset(split_extensions(ext_str))
+        self._max_dots = max((ext.count('.') for ext in self.exts), default=0)
+
+    def find(self, filename: str) -> str | None:
+        """
+        :return: the matched normalized extension, longest one first
+        """
+        found = None
+        for suffix in iter_suffixes(filename, self._max_dots):
+            if suffix in self.exts: found = suffix
+        return found
+
+    def match(self, filename: str) -> bool:
+        return self.find(filename) is not None
+
+    def __contains__(self, ext: str) -> bool:
+        return ext.lower() in self.exts
@@ -0,0 +1,115 @@
+import os
+import time
+
+
+class DirWatcher():
+    """
+    Poll a directory tree for changed files with stat fingerprints (mtime, size).
+    Directories are checked every poll for added / removed entries, files are checked round-robin
+    within a time budget, so a poll costs about the same no matter how many files there are.
+    """
+
+    def __init__(self, root, suffixes: tuple[str, ...] = None, recursive: bool = True):
+        self.root = str(root)
+        self.suffixes = suffixes
+        self.recursive = recursive
+        self._dirs: dict[str, int] = {}  # directory: mtime_ns
+        self._files: dict[str, tuple[int, int]] = {}  # path: (mtime_ns, size)
+        self._order: list[str] = []  # files in round-robin order
+        self._cursor = 0
+        self.last_poll = 0.0  # seconds
+        self.max_poll = 0.0
+
+    def _scan_dir(self, directory: str, added: set[str], removed: set[str]):
+        """compare the entries of a directory with the known ones"""
+        try:
+            st = os.stat(directory)
+            entries = list(os.scandir(directory))
+        except OSError:
+            self._forget_dir(directory, removed)
+            return
+        self._dirs[directory] = st.st_mtime_ns
+
+        known = {path for path in self._files if os.path.dirname(path) == directory}
+        for entry in entries:
+            if entry.is_dir():
+                if self.recursive and entry.path not in self._dirs:
+                    self._scan_dir(entry.path, added, removed)
+                continue
+            if self.suffixes and not entry.name.endswith(self.suffixes): continue
+            if entry.path in known:
+                known.discard(entry.path)
+                continue
+            st = entry.stat()
+            self._files[entry.path] = (st.st_mtime_ns, st.st_size)
+            self._order.append(entry.path)
+            added.add(entry.path)
+
+        for path in known:
+            self._files.pop(path)
+            removed.add(path)
+        for sub in [d for d in self._dirs if os.path.dirname(d) == directory]:
+            if not os.path.isdir(sub):
+                self._forget_dir(sub, removed)
+
+    def _forget_dir(self, directory: str, removed: set[str]):
+        prefix = directory + os.sep
+        for d in [d for d in self._dirs if d == directory or d.startswith(prefix)]:
+            self._dirs.pop(d)
+        for path in [path for path in self._files if path.startswith(prefix)]:
+            self._files.pop(path)
+            removed.add(path)
+
+    def poll(self, budget: float = 0.0005) -> tuple[set[str], set[str], set[str]]:
+        """
+        :param budget: seconds to spend on checking files, at least one file is checked
+        :return: added, removed, modified file paths since the last poll
+        """
+        start = time.perf_counter()
+        added, removed, modified = set(), set(), set()
+
+        if not self._dirs:
+            self._scan_dir(self.root, set(), removed)  # first poll only takes the fingerprints
+            removed.clear()
+        else:
+            for directory, mtime in list(self._dirs.items()):
+                if directory not in self._dirs: continue  # forgotten with its parent
+                try:
+                    changed = os.stat(directory).st_mtime_ns != mtime
+                except OSError:
+                    changed = True
+                if changed:
+                    self._scan_dir(directory, added, removed)
+
+        if removed:
+            self._order = [path for path in self._order if path in self._files]
+        if self._order:
+            checked = 0
+            while checked < len(self._order):
+                if self._cursor >= len(self._order): self._cursor = 0
+                path = self._order[self._cursor]
+                self._cursor += 1
+                checked += 1
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue  # removed, found with its directory on the next poll
+                stamp = (st.st_mtime_ns, st.st_size)
+                if stamp != self._files[path]:
+                    self._files[path] = stamp
+                    if path not in added: modified.add(path)
+                if time.perf_counter() - start > budget: break
+
+        self.last_poll = time.perf_counter() - start
+        self.max_poll = max(self.max_poll, self.last_poll)
+        return added, removed, modified
+
+    def reset(self):
+        self._dirs.clear()
+        self._files.clear()
+        self._order.clear()
+        self._cursor = 0
+
+    def stats(self) -> dict[str, float]:
+        return {'dirs': len(self._dirs), 'files': len(self._files),
+                'last_poll_ms': self.last_poll * 1000, 'max_poll_ms': self.max_poll * 1000}
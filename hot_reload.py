@@ -0,0 +1,71 @@
+import bpy
+
+from .public_path import get_ConfigDir, get_ScriptDir, G_script_index
+from .config_repo import G_config_repo
+from .script_cache import G_script_cache
+from .file_watcher import DirWatcher
+
+C_WATCH_INTERVAL = 1.0  # seconds between polls
+
+G_config_watcher = DirWatcher(get_ConfigDir(), suffixes=('.json',), recursive=False)
+G_script_watcher = DirWatcher(get_ScriptDir(), suffixes=('.py',))
+
+
+def reload_scripts(added: set[str], removed: set[str], modified: set[str]):
+    for path in removed | modified:
+        G_script_cache.invalidate(path)
+        G_script_index.forget(path)
+    if added or removed:
+        G_script_index.refresh(force=True)
+
+
+def reload_configs():
+    """parse the changed config files and update only the changed operators"""
+    from . import _runtime
+    from .display import load_config_wm, G_dirty_categories
+
+    changed = G_config_repo.refresh()
+    if not changed: return
+    if G_dirty_categories:
+        print(f'CDI: config list not reloaded, unsaved edits in {", ".join(sorted(G_dirty_categories))}')
+    else:
+        load_config_wm()
+    counts = _runtime.ensure_op_handles()
+    print(f'CDI: reloaded config {", ".join(sorted(changed))}: {counts["added"]} added, '
+          f'{counts["removed"]} removed, {counts["changed"]} changed')
+
+
+def watch_tick():
+    scripts = G_script_watcher.poll()
+    if any(scripts):
+        reload_scripts(*scripts)
+    if any(G_config_watcher.poll()):
+        try:
+            reload_configs()
+        except (ValueError, OSError) as e:  # keep watching
+            print(f'CDI: can not reload config: {e}')
+    return C_WATCH_INTERVAL
+
+
+def set_watch(enable: bool):
+    if enable and not bpy.app.timers.is_registered(watch_tick):
+        # take the fingerprints now, so the first tick only reports changes
+        G_config_watcher.poll()
+        G_script_watcher.poll()
+        bpy.app.timers.register(watch_tick, first_interval=C_WATCH_INTERVAL, persistent=True)
+    elif not enable and bpy.app.timers.is_registered(watch_tick):
+        bpy.app.timers.unregister(watch_tick)
+        G_config_watcher.reset()
+        G_script_watcher.reset()
+
+
+def register():
+    from .display import get_pref
+    try:
+        set_watch(get_pref().watch_files)
+    except (KeyError, AttributeError):
+        pass
+
+
+def unregister():
+    set_watch(False)
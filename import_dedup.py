@@ -0,0 +1,99 @@
+import bpy
+import hashlib
+import os
+from bpy.app.handlers import persistent
+from mathutils import Matrix
+
+C_HASH_CHUNK = 1024 * 1024
+
+
+class ImportDedup():
+    """
+    Remember objects imported from each file content in this session,
+    so dropping the same content again creates linked duplicates (shared data) instead of importing again.
+    """
+
+    def __init__(self):
+        self._hashes: dict[str, tuple[int, int, str]] = {}  # path: (size, mtime_ns, digest)
+        # import key: [(object name, session_uid, matrix_world)]
+        self._imports: dict[tuple, list[tuple[str, int, Matrix]]] = {}
+
+    def file_hash(self, filepath: str) -> str | None:
+        """
+        content hash of a file, not read again if size and mtime did not change
+        :return: None if the file can not be read, it is imported normally
+        """
+        try:
+            st = os.stat(filepath)
+            cached = self._hashes.get(filepath)
+            if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+                return cached[2]
+
+            h = hashlib.blake2b(digest_size=16)
+            with open(filepath, 'rb') as f:
+                while chunk := f.read(C_HASH_CHUNK):
+                    h.update(chunk)
+        except OSError:
+            return None
+        digest = h.hexdigest()
+        self._hashes[filepath] = (st.st_size, st.st_mtime_ns, digest)
+        return digest
+
+    @staticmethod
+    def import_key(op, digest: str) -> tuple:
+        """the same content imported by another config (operator, options, scripts) is imported again"""
+        return op.bl_idname, op.bl_import_operator, repr(op.kwargs), digest
+
+    def remember(self, key: tuple, objects: list[bpy.types.Object]):
+        if not objects: return
+        self._imports[key] = [(obj.name, obj.session_uid, obj.matrix_world.copy()) for obj in objects]
+
+    def instance(self, context, key: tuple) -> list[bpy.types.Object] | None:
+        """
+        create linked duplicates of the objects imported from the same content
+        :return: new objects, None if nothing to instance from
+        """
+        records = self._imports.get(key)
+        if not records: return None
+
+        # the name may now be another object, renamed or created after a removal
+        src_objs = [bpy.data.objects.get(name) for name, _, _ in records]
+        if any(obj is None or obj.session_uid != uid for obj, (_, uid, _) in zip(src_objs, records)):
+            self._imports.pop(key)  # import again
+            return None
+
+        copies = {}
+        for src, (_, _, matrix) in zip(src_objs, records):
+            obj = src.copy()  # object data is shared
+            context.collection.objects.link(obj)
+            copies[src] = (obj, matrix)
+
+        for src, (obj, matrix) in copies.items():
+            if src.parent in copies:
+                obj.parent = copies[src.parent][0]
+            else:
+                obj.matrix_world = matrix  # place as the first import did
+
+        return [obj for obj, _ in copies.values()]
+
+    def clear(self):
+        self._hashes.clear()
+        self._imports.clear()
+
+
+G_import_dedup = ImportDedup()
+
+
+@persistent
+def clear_on_load(dummy):
+    G_import_dedup.clear()
+
+
+def register():
+    bpy.app.handlers.load_post.append(clear_on_load)
+
+
+def unregister():
+    if clear_on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(clear_on_load)
+    G_import_dedup.clear()
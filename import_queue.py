@@ -0,0 +1,120 @@
+import bpy
+import time
+import traceback
+from collections import deque
+
+from .wrap_handle import ImportJob, suspend_global_undo
+
+C_TICK_BUDGET = 0.05  # seconds of import per timer tick, the ui stays responsive in between
+C_TICK_INTERVAL = 0.01
+
+G_import_queue: deque[ImportJob] = deque()  # drops waiting, the first one is being imported
+
+
+def enqueue(job: ImportJob):
+    """queue a drop, start the queue operator if it is not running"""
+    G_import_queue.append(job)
+    if not CDI_OT_import_queue.running:
+        bpy.ops.cdi.import_queue('INVOKE_DEFAULT')
+
+
+class CDI_OT_import_queue(bpy.types.Operator):
+    """Import queued drops a few files per tick, Esc to cancel"""
+    bl_idname = 'cdi.import_queue'
+    bl_label = 'Import Queue'
+    bl_options = {'INTERNAL'}  # undo is pushed per finished drop, not for the no undo ones
+
+    running = False  # one operator imports all queued drops
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        self._steps = None
+        self._timer = wm.event_timer_add(C_TICK_INTERVAL, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, 1)
+        CDI_OT_import_queue.running = True
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            self.cancel_jobs()
+            return {'RUNNING_MODAL'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        start = time.perf_counter()
+        while G_import_queue and time.perf_counter() - start < C_TICK_BUDGET:
+            self.step(context)
+
+        if not G_import_queue:
+            self.finish(context)
+            return {'FINISHED'}
+        self.show_progress(context)
+        return {'RUNNING_MODAL'}
+
+    def step(self, context):
+        job = G_import_queue[0]
+        if self._steps is None:
+            job.report = self.report
+            self._steps = job.steps(bpy.context)  # the context of each tick, not the one of the first
+        try:
+            if job.op.no_undo:
+                with suspend_global_undo(context):
+                    next(self._steps)
+            else:
+                next(self._steps)
+        except StopIteration:
+            self.next_job()
+        except Exception as e:
+            traceback.print_exc()
+            self.report({'ERROR'}, f'{job.op.bl_label}: {e}')
+            self.next_job()
+
+    def next_job(self):
+        job = G_import_queue.popleft()
+        self._steps = None
+        if not job.op.no_undo:
+            bpy.ops.ed.undo_push(message=job.op.bl_label)
+
+    def cancel_jobs(self):
+        """cancel the drop being imported after its current file, drop the ones waiting"""
+        jobs = list(G_import_queue)
+        G_import_queue.clear()
+        if self._steps is not None:
+            current = jobs.pop(0)
+            current.cancel()
+            G_import_queue.append(current)  # finishes its post script on the next tick
+        if jobs:
+            self.report({'WARNING'}, f'Import cancelled, {len(jobs)} queued drops removed')
+
+    def show_progress(self, context):
+        done = sum(job.done for job in G_import_queue)
+        total = sum(job.total for job in G_import_queue)
+        context.window_manager.progress_update(done / total if total else 0)
+        job = G_import_queue[0]
+        context.workspace.status_text_set(f'Importing {job.op.bl_label}: {job.done} / {job.total}, '
+                                          f'{len(G_import_queue) - 1} drops queued (Esc to cancel)')
+
+    def finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        CDI_OT_import_queue.running = False
+
+    def cancel(self, context):
+        """removed by blender, like when loading another file"""
+        if self._steps is not None:
+            self._steps.close()
+        G_import_queue.clear()
+        self.finish(context)
+
+
+def register():
+    bpy.utils.register_class(CDI_OT_import_queue)
+
+
+def unregister():
+    G_import_queue.clear()
+    bpy.utils.unregister_class(CDI_OT_import_queue)
+    CDI_OT_import_queue.running = False
@@ -0,0 +1,116 @@
+import bpy
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+# bpy.data collections counted as "created datablocks" for each file
+C_ID_COLLECTIONS = ('objects', 'meshes', 'materials', 'images', 'node_groups', 'collections', 'textures',
+                    'curves', 'armatures', 'actions', 'cameras', 'lights')
+
+G_reports: deque[dict] = deque(maxlen=10)
+
+
+def count_ids() -> int:
+    return sum(len(getattr(bpy.data, attr)) for attr in C_ID_COLLECTIONS)
+
+
+def set_history_size(size: int):
+    global G_reports
+    G_reports = deque(G_reports, maxlen=max(1, size))
+
+
+def get_reports() -> list[dict]:
+    return list(G_reports)
+
+
+def dump_reports(filepath: str) -> int:
+    """write reports as json lines
+    :return: count of reports
+    """
+    reports = get_reports()
+    with open(filepath, 'w', encoding='utf-8') as f:
+        for report in reports:
+            f.write(json.dumps(report) + '\n')
+    return len(reports)
+
+
+class NullRecorder():
+    """used when the report is disabled, every call is a no-op"""
+    _null = nullcontext()
+
+    def phase(self, name: str):
+        return self._null
+
+    def begin_file(self, filepath: str):
+        pass
+
+    def end_file(self):
+        pass
+
+    def finish(self):
+        pass
+
+
+class ImportRecorder():
+    """records monotonic timings of one drop"""
+
+    def __init__(self, label: str, bl_import_operator: str):
+        self.report = {
+            'label': label,
+            'operator': bl_import_operator,
+            'time': time.time(),
+            'total': 0.0,
+            'phases': {},
+            'files': [],
+        }
+        self._start = time.monotonic()
+        self._file = None
+        self._file_start = 0.0
+        self._file_ids = 0
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            phases = self.report['phases']
+            phases[name] = phases.get(name, 0.0) + time.monotonic() - start
+
+    def begin_file(self, filepath: str):
+        try:
+            size = os.path.getsize(filepath)
+        except OSError:
+            size = -1
+        self._file = {'file': filepath, 'size': size, 'seconds': 0.0, 'datablocks': 0}
+        self._file_ids = count_ids()
+        self._file_start = time.monotonic()
+
+    def end_file(self):
+        if self._file is None: return
+        self._file['seconds'] = time.monotonic() - self._file_start
+        self._file['datablocks'] = count_ids() - self._file_ids
+        self.report['files'].append(self._file)
+        self._file = None
+
+    def finish(self):
+        self.report['total'] = time.monotonic() - self._start
+        G_reports.append(self.report)
+
+
+G_null_recorder = NullRecorder()
+
+
+def new_recorder(label: str, bl_import_operator: str) -> ImportRecorder | NullRecorder:
+    from .display import get_pref
+    try:
+        pref = get_pref()
+    except KeyError:
+        return G_null_recorder
+    if not pref.enable_import_report:
+        return G_null_recorder
+    if G_reports.maxlen != pref.import_report_size:
+        set_history_size(pref.import_report_size)
+    return ImportRecorder(label, bl_import_operator)
@@ -0,0 +1,93 @@
+import bpy
+
+# bpy.data collections tracked for new datablocks
+C_TRACK_COLLECTIONS = ('objects', 'meshes', 'materials', 'images', 'node_groups')
+
+
+def _session_uids(coll) -> list[int]:
+    uids = [0] * len(coll)
+    try:
+        coll.foreach_get('session_uid', uids)
+    except (TypeError, AttributeError, RuntimeError):
+        uids = [id.session_uid for id in coll]
+    return uids
+
+
+class ImportTracker():
+    """
+    Find datablocks created by each import call.
+    Every ID gets a session_uid from a global increasing counter, so new datablocks are the ones above
+    the watermark taken before the call. Collections whose length did not change are skipped.
+    """
+
+    def __init__(self, context, collections: tuple[str, ...] = C_TRACK_COLLECTIONS):
+        self.collections = collections
+        self.tree = getattr(context.space_data, 'edit_tree', None) if hasattr(context, 'selected_nodes') else None
+        # all imported of the drop, per file
+        self.new_objects: list[list[bpy.types.Object]] = []
+        self.new_nodes: list[list[bpy.types.Node]] = []
+        self._new_node_names: list[str] = []  # nodes are not IDs, found again by name
+
+        self._lens = {}
+        self._nodes = set()
+        self._watermark = 0
+        for attr in collections:
+            uids = _session_uids(getattr(bpy.data, attr))
+            if uids: self._watermark = max(self._watermark, max(uids))
+        self._snapshot()
+
+    def _snapshot(self):
+        self._lens = {attr: len(getattr(bpy.data, attr)) for attr in self.collections}
+        if self.tree is not None:
+            self._nodes = {node.name for node in self.tree.nodes}
+
+    def diff(self) -> dict:
+        """
+        collect datablocks created since the last call
+        :return: {'new_objects': [Object], 'new_datablocks': {collection: [ID]}, 'new_nodes': [Node]}
+        """
+        new_datablocks = {}
+        watermark = self._watermark
+        for attr in self.collections:
+            coll = getattr(bpy.data, attr)
+            if len(coll) == self._lens[attr]: continue
+            uids = _session_uids(coll)
+            new_ids = [coll[i] for i, uid in enumerate(uids) if uid > self._watermark]
+            if not new_ids: continue
+            new_datablocks[attr] = new_ids
+            watermark = max(watermark, max(uids))
+        self._watermark = watermark
+
+        new_nodes = []
+        if self.tree is not None:
+            new_nodes = [node for node in self.tree.nodes if node.name not in self._nodes]
+
+        self._snapshot()
+        objects = new_datablocks.get('objects', [])
+        self.new_objects.append(objects)
+        self.new_nodes.append(new_nodes)
+        self._new_node_names.extend(node.name for node in new_nodes)
+        return {'new_objects': objects, 'new_datablocks': new_datablocks, 'new_nodes': new_nodes}
+
+    def restore_selection(self, context):
+        """
+        select everything imported in the drop, just like blender's default drag
+        skip what the foreach post scripts removed, joined or unlinked from the view layer
+        """
+        view_objects = context.view_layer.objects
+        for obj_list in self.new_objects:
+            for obj in obj_list:
+                try:
+                    if view_objects.get(obj.name) == obj:
+                        obj.select_set(True)
+                except ReferenceError:  # removed
+                    continue
+        if self.tree is not None:
+            first = None
+            for name in self._new_node_names:
+                node = self.tree.nodes.get(name)
+                if node is None: continue
+                node.select = True
+                if first is None: first = node
+            if first is not None:
+                self.tree.nodes.active = first
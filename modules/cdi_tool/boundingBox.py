@@ -7,6 +7,8 @@ from mathutils.bvhtree import BVHTree
 C_OBJECT_TYPE_HAS_BBOX = {'MESH', 'CURVE', 'FONT', 'LATTICE'}
 # 创建bbox的面顶点顺序
 faces = [(0, 1, 2, 3), (4, 7, 6, 5), (0, 4, 5, 1), (1, 5, 6, 2), (2, 6, 7, 3), (4, 0, 3, 7)]
+# 包围盒8个点取最大值的轴, 与 _calc_bbox_pts 的点顺序一致 (x, y, z)
+C_CORNER_MAX = np.array([[(i >> (2 - axis)) & 1 for axis in range(3)] for i in range(8)], dtype=bool)
 
 
 class ObjectBoundingBox():
@@ -294,43 +296,28 @@ class ObjectBoundingBox():
 
 
 class ObjectsBoundingBox():
+    """所有物体的世界坐标包围盒, 创建时计算一次"""
+
     def __init__(self, obj_list: list[ObjectBoundingBox]):
         self.obj_list = obj_list
-        self._bbox_pts = self.get_bbox_pts()
+        self._bbox_pts = self._calc_bbox_pts()
+        self._bbox_center = Vector(((self.min_x + self.max_x) / 2,
+                                    (self.min_y + self.max_y) / 2,
+                                    (self.min_z + self.max_z) / 2))
         self.bvh_tree_update()
 
     def _calc_bbox_pts(self) -> list[Vector]:
-        """计算所有物体的包围盒的8个点"""
-        obj = self.obj_list[0]
-        obj.is_local = False
-        bbox_pts = obj.get_bbox_pts(is_local=False)
-
-        max_x = max(bbox_pts, key=lambda v: v.x).x
-        max_y = max(bbox_pts, key=lambda v: v.y).y
-        max_z = max(bbox_pts, key=lambda v: v.z).z
-
-        min_x = min(bbox_pts, key=lambda v: v.x).x
-        min_y = min(bbox_pts, key=lambda v: v.y).y
-        min_z = min(bbox_pts, key=lambda v: v.z).z
-
-        for obj in self.obj_list:
-            obj.is_local = False
-            bbox_pts = obj.get_bbox_pts(is_local=False)
-
-            max_x = max(max_x, max(bbox_pts, key=lambda v: v.x).x)
-            max_y = max(max_y, max(bbox_pts, key=lambda v: v.y).y)
-            max_z = max(max_z, max(bbox_pts, key=lambda v: v.z).z)
-
-            min_x = min(min_x, min(bbox_pts, key=lambda v: v.x).x)
-            min_y = min(min_y, min(bbox_pts, key=lambda v: v.y).y)
-            min_z = min(min_z, min(bbox_pts, key=lambda v: v.z).z)
-
-        self.min_x = min_x
-        self.min_y = min_y
-        self.min_z = min_z
-        self.max_x = max_x
-        self.max_y = max_y
-        self.max_z = max_z
+        """计算所有物体的包围盒的8个点, 所有物体的角点 (N,8,4) 一次乘以各自的 matrix_world"""
+        bounds = np.array([(obj.min_x, obj.min_y, obj.min_z, obj.max_x, obj.max_y, obj.max_z)
+                           for obj in self.obj_list], dtype=np.float64)
+        matrices = np.array([obj.mx for obj in self.obj_list], dtype=np.float64)  # (N,4,4)
+
+        corners = np.ones((len(bounds), 8, 4))
+        corners[:, :, :3] = np.where(C_CORNER_MAX, bounds[:, None, 3:], bounds[:, None, :3])
+        world_pts = np.einsum('nij,nkj->nki', matrices, corners)[:, :, :3].reshape(-1, 3)
+
+        self.min_x, self.min_y, self.min_z = (float(v) for v in world_pts.min(axis=0))
+        self.max_x, self.max_y, self.max_z = (float(v) for v in world_pts.max(axis=0))
 
         x = self.min_x, self.max_x
         y = self.min_y, self.max_y
@@ -346,13 +333,10 @@ class ObjectsBoundingBox():
         return bbox_pts
 
     def get_bbox_pts(self) -> list[Vector]:
-        return self._calc_bbox_pts()
+        return [pt.copy() for pt in self._bbox_pts]
 
     def get_bbox_center(self) -> Vector:
-        total = Vector((0, 0, 0))
-        for v in self.get_bbox_pts():
-            total = total + v
-        return total / 8
+        return self._bbox_center.copy()
 
     def get_bottom_center(self) -> Vector:
         pt = self.get_bbox_center()
@@ -0,0 +1,212 @@
+import bpy
+import json
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from .public_path import get_ScriptFile
+
+C_WORKER_SCRIPT = Path(__file__).parent.joinpath('parallel_worker.py')
+C_COLLECTION = 'CDI_IMPORT'  # same as parallel_worker.C_COLLECTION
+# operators that need a window / editor context, or do not create scene data
+C_HEADLESS_UNSAFE_OPERATORS = {
+    'image.open',
+    'node.add_file',
+    'text.open',
+    'sequencer.image_strip_add',
+    'sequencer.movie_strip_add',
+    'sequencer.sound_strip_add',
+    'wm.open_mainfile',
+    'wm.append',
+    'wm.link',
+}
+# areas where the import result is plain scene data that can be appended
+C_HEADLESS_SAFE_AREAS = {'VIEW_3D'}
+
+
+def is_headless_safe(bl_import_operator: str, poll_area: str) -> bool:
+    if poll_area not in C_HEADLESS_SAFE_AREAS: return False
+    if bl_import_operator in C_HEADLESS_UNSAFE_OPERATORS: return False
+    return '.' in bl_import_operator
+
+
+class _Worker():
+    """one background blender process, fed one file at a time through stdin"""
+
+    def __init__(self, setup_path: str, messages: queue.Queue):
+        self.task: tuple[int, float] | None = None  # (index, start time)
+        self.proc = subprocess.Popen(
+            [bpy.app.binary_path, '-b', '--python', str(C_WORKER_SCRIPT), '--', setup_path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8', errors='replace', bufsize=1)
+        self._reader = threading.Thread(target=self._read, args=(messages,), daemon=True)
+        self._reader.start()
+
+    def _read(self, messages: queue.Queue):
+        for line in self.proc.stdout:
+            if line.startswith('CDI_DONE'):
+                messages.put((self, line.strip()))
+        messages.put((self, None))  # process exit
+
+    def send(self, index: int, filepath: str, output: str):
+        self.task = (index, time.monotonic())
+        self.proc.stdin.write(json.dumps({'index': index, 'filepath': filepath, 'output': output}) + '\n')
+        self.proc.stdin.flush()
+
+    def close(self):
+        try:
+            self.proc.stdin.write('\n')
+            self.proc.stdin.close()
+            self.proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+    def kill(self):
+        try:
+            self.proc.kill()
+        except OSError:
+            pass
+
+
+class ParallelImporter():
+    """
+    Import files in background blender processes, each file is saved to a temporary .blend
+    and appended back in drop order. Files that fail or time out are returned for in-process import.
+    """
+
+    def __init__(self, bl_import_operator: str, directory: str, files: list[str], kwargs: dict = None,
+                 foreach_pre_script: str = None, foreach_post_script: str = None,
+                 workers: int = 4, timeout: float = 300):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.directory = directory
+        self.tmp_dir = Path(tempfile.mkdtemp(prefix='cdi_'))
+        self.outputs: dict[int, str] = {}
+
+        setup = {
+            'bl_import_operator': bl_import_operator,
+            'kwargs': kwargs or {},
+            'directory': directory,
+            'files': files,
+            'foreach_pre_script': self._resolve_scripts(foreach_pre_script),
+            'foreach_post_script': self._resolve_scripts(foreach_post_script),
+            'modules': str(Path(__file__).parent.joinpath('modules')),
+        }
+        self.setup_path = str(self.tmp_dir.joinpath('setup.json'))
+        with open(self.setup_path, 'w', encoding='utf-8') as f:
+            json.dump(setup, f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _resolve_scripts(script: str | None) -> list[str]:
+        if not script: return []
+        paths = []
+        for s in script.split(';'):
+            file = get_ScriptFile(s)
+            if not file: break  # same as ImportJob._exec_script
+            paths.append(str(file))
+        return paths
+
+    def run(self, matched: list[tuple[int, str]]) -> list[int]:
+        """
+        import files in workers
+        :param matched: [(index, filename)]
+        :return: indexes of files that need to be imported in process
+        """
+        pending = deque(matched)
+        fallback = []
+        messages = queue.Queue()
+        workers: list[_Worker] = []
+        spawn_budget = self.workers + len(matched)  # stop respawning if blender keeps crashing
+
+        def spawn():
+            nonlocal spawn_budget
+            if spawn_budget <= 0: return
+            spawn_budget -= 1
+            try:
+                workers.append(_Worker(self.setup_path, messages))
+            except OSError as e:
+                print('CDI: Unable to start import worker:', e)
+                spawn_budget = 0
+
+        def drop(worker: _Worker):
+            if worker.task is not None:
+                fallback.append(worker.task[0])
+            worker.kill()
+            workers.remove(worker)
+            if pending: spawn()
+
+        for _ in range(min(self.workers, len(matched))):
+            spawn()
+
+        while workers and (pending or any(w.task for w in workers)):
+            for worker in workers:
+                if worker.task is None and pending:
+                    index, file = pending.popleft()
+                    output = str(self.tmp_dir.joinpath(f'{index}.blend'))
+                    self.outputs[index] = output
+                    try:
+                        worker.send(index, os.path.join(self.directory, file), output)
+                    except OSError:
+                        worker.task = (index, time.monotonic())
+
+            try:
+                worker, line = messages.get(timeout=0.1)
+            except queue.Empty:
+                worker, line = None, None
+
+            if worker in workers:
+                if line is None:
+                    drop(worker)
+                else:
+                    _, index, ok, *_msg = line.split(maxsplit=3)
+                    if ok != '1': fallback.append(int(index))
+                    worker.task = None
+
+            now = time.monotonic()
+            for worker in [w for w in workers if w.task and now - w.task[1] > self.timeout]:
+                print(f'CDI: Import worker timeout on file index {worker.task[0]}')
+                drop(worker)
+
+        for worker in workers:
+            worker.close()
+
+        # no worker left to take them
+        fallback.extend(index for index, _ in pending)
+        for index in fallback:
+            self.outputs.pop(index, None)
+
+        return sorted(fallback)
+
+    def append(self, context, index: int) -> list[bpy.types.Object]:
+        """append the result of one file into the active collection
+        :return: appended objects
+        """
+        output = self.outputs.get(index)
+        if output is None or not os.path.exists(output): return []
+
+        with bpy.data.libraries.load(output, link=False) as (data_from, data_to):
+            data_to.collections = [C_COLLECTION] if C_COLLECTION in data_from.collections else []
+        if not data_to.collections: return []
+
+        coll = data_to.collections[0]
+        target = context.collection
+        objs = list(coll.all_objects)
+        for obj in coll.objects:
+            target.objects.link(obj)
+        for child in coll.children:
+            target.children.link(child)
+        bpy.data.collections.remove(coll)
+
+        return objs
@@ -0,0 +1,86 @@
+"""
+Headless import worker, started by parallel_import.py with:
+blender -b --python parallel_worker.py -- setup.json
+
+Each line on stdin is a json task {"index": int, "filepath": str, "output": str}.
+The file is imported into an empty scene, all imported data is gathered in one collection and saved to "output".
+Result of each task is printed as: CDI_DONE <index> <1|0> [error]
+An empty line or EOF stops the worker.
+"""
+import bpy
+import json
+import sys
+import traceback
+
+C_COLLECTION = 'CDI_IMPORT'
+
+
+def load_setup() -> dict:
+    argv = sys.argv[sys.argv.index('--') + 1:]
+    with open(argv[0], 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def exec_scripts(codes: dict, paths: list[str], kwargs: dict):
+    for path in paths:
+        if path not in codes:
+            with open(path, 'rb') as f:
+                codes[path] = compile(f.read(), path, 'exec')
+        exec(codes[path], {**kwargs})
+
+
+def gather_collection() -> bpy.types.Collection:
+    """link everything in the scene to one collection so the main process can append it"""
+    coll = bpy.data.collections.new(C_COLLECTION)
+    scene_coll = bpy.context.scene.collection
+    for obj in scene_coll.objects:
+        coll.objects.link(obj)
+    for child in scene_coll.children:
+        coll.children.link(child)
+    coll.use_fake_user = True
+    return coll
+
+
+def import_file(setup: dict, codes: dict, task: dict):
+    bpy.ops.wm.read_homefile(use_empty=True)
+
+    cat, name = setup['bl_import_operator'].split('.')
+    op_callable = getattr(getattr(bpy.ops, cat), name)
+    filepath = task['filepath']
+    kwargs = {'filepath': filepath, 'index': task['index'], 'event': None,
+              'directory': setup['directory'], 'files': setup['files'],
+              'selected_objects': [], 'selected_nodes': []}
+
+    exec_scripts(codes, setup['foreach_pre_script'], kwargs)
+    op_callable('EXEC_DEFAULT', filepath=filepath, **setup['kwargs'])
+    # the scene is empty before import, so everything in it is new
+    new_objects = list(bpy.context.scene.objects)
+    kwargs['selected_objects'].append(new_objects)
+    kwargs.update({'new_objects': new_objects, 'new_datablocks': {'objects': new_objects}, 'new_nodes': []})
+    exec_scripts(codes, setup['foreach_post_script'], kwargs)
+
+    gather_collection()
+    bpy.ops.wm.save_as_mainfile(filepath=task['output'], check_existing=False, compress=False)
+
+
+def main():
+    setup = load_setup()
+    sys.path.append(setup['modules'])
+    codes = {}
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line: break
+        task = json.loads(line)
+        try:
+            import_file(setup, codes, task)
+        except Exception as e:
+            traceback.print_exc()
+            msg = str(e).replace('\n', ' ')
+            print(f'CDI_DONE {task["index"]} 0 {msg}', flush=True)
+        else:
+            print(f'CDI_DONE {task["index"]} 1', flush=True)
+
+
+if __name__ == '__main__':
+    main()
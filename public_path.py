@@ -1,5 +1,7 @@
+import ast
 import json
 import os
+import time
 from pathlib import Path
 from enum import Enum
 from typing import Union
@@ -33,21 +35,194 @@ def get_ConfigFile(filename=ConfigFiles.DEFAULT.value) -> Path:
     return get_AssetDir_path(AssetDir.CONFIG).joinpath(filename)
 
 
+def write_atomic(path, data: Union[str, bytes]):
+    """write a temp file next to path then replace it, so a crash never leaves a truncated file"""
+    path = Path(path)
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        if isinstance(data, bytes):
+            with open(tmp, 'wb') as f:
+                f.write(data)
+        else:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def save_ConfigFile(filename=ConfigFiles.DEFAULT.value, data: dict = None):
     if not data: return
-    path = get_ConfigFile(filename)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, fp=f)
+    write_atomic(get_ConfigFile(filename), json.dumps(data))
+
+
+def get_IdnameMapFile() -> Path:
+    """persisted config -> operator idname mapping, outside the config folder"""
+    return Path(__file__).parent.joinpath('asset', 'idnames.json')
+
+
+def get_ConfigSnapshotFile() -> Path:
+    """parsed configs cache, outside the config folder so it is never read as a config"""
+    return Path(__file__).parent.joinpath('asset', 'config_snapshot.bin')
 
 
 def get_ScriptDir() -> Path:
     return get_AssetDir_path(AssetDir.SCRIPTS)
 
 
+# top level variable a script declares its phases with: CDI_PHASES = ('post_script',)
+C_PHASES_VAR = 'CDI_PHASES'
+C_STALE_CHECK_INTERVAL = 1.0  # seconds between directory checks of a lookup, the file watcher reloads faster
+
+
+def read_script_info(path: Path) -> tuple[str, tuple[str, ...]]:
+    """
+    parse a script without running it
+    :return: first line of the docstring, phases declared with CDI_PHASES (empty if not declared)
+    """
+    try:
+        with open(path, 'rb') as f:
+            module = ast.parse(f.read(), str(path))
+    except (OSError, SyntaxError, ValueError):
+        return '', ()
+
+    doc = (ast.get_docstring(module) or '').strip().split('\n')[0]
+    phases = ()
+    for node in module.body:
+        if not isinstance(node, ast.Assign): continue
+        if not any(isinstance(t, ast.Name) and t.id == C_PHASES_VAR for t in node.targets): continue
+        try:
+            value = ast.literal_eval(node.value)
+        except ValueError:
+            continue
+        phases = (value,) if isinstance(value, str) else tuple(v for v in value if isinstance(v, str))
+    return doc, phases
+
+
+class ScriptIndex():
+    """name -> path index of the script directory, rebuilt only when a directory mtime changes"""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.files: dict[str, Path] = {}
+        self.conflicts: dict[str, list[Path]] = {}  # duplicate names, first path is the one in use
+        self.generation = 0  # increased on each rebuild
+        self._dir_mtimes: dict[str, Union[int, None]] = {}
+        self._checked = 0.0  # time of the last directory check
+        self._infos: dict[Path, tuple[tuple[int, int], str, tuple[str, ...]]] = {}  # path: (stamp, doc, phases)
+        self._listings: dict[str, tuple[int, list[tuple[str, Path, str]]]] = {}  # phase: (generation, scripts)
+
+    @staticmethod
+    def _mtime(directory: str) -> Union[int, None]:
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def is_stale(self) -> bool:
+        if not self._dir_mtimes: return True
+        self._checked = time.monotonic()
+        for directory, mtime in self._dir_mtimes.items():
+            if self._mtime(directory) != mtime: return True
+        return False
+
+    def refresh(self, force: bool = False) -> bool:
+        """rebuild the index if needed
+        :return: True if the index has been rebuilt
+        """
+        if not force:
+            if self._dir_mtimes and time.monotonic() - self._checked < C_STALE_CHECK_INTERVAL: return False
+            if not self.is_stale(): return False
+
+        files = {}
+        conflicts = {}
+        dir_mtimes = {str(self.root): self._mtime(str(self.root))}
+        for root, dirs, filenames in os.walk(self.root):
+            dirs.sort()
+            for d in dirs:
+                directory = os.path.join(root, d)
+                dir_mtimes[directory] = self._mtime(directory)
+            for file in sorted(filenames):
+                path = Path(root).joinpath(file)
+                if file in files:
+                    conflicts.setdefault(file, [files[file]]).append(path)
+                else:
+                    files[file] = path
+
+        for file, paths in conflicts.items():
+            if paths != self.conflicts.get(file):
+                print(f'CDI: Duplicate script name "{file}", using {paths[0]}, ignored: {paths[1:]}')
+
+        self.files = files
+        self.conflicts = conflicts
+        self._dir_mtimes = dir_mtimes
+        self._checked = time.monotonic()
+        self.generation += 1
+        return True
+
+    def validate(self) -> bool:
+        """check the directories now, once per drop, the lookups of the drop are then dict hits"""
+        self._checked = 0.0
+        return self.refresh()
+
+    def get(self, filename) -> Union[Path, None]:
+        self.refresh()
+        return self.files.get(filename)
+
+    def items(self) -> list[tuple[str, Path]]:
+        self.refresh()
+        return list(self.files.items())
+
+    def info(self, path: Path) -> tuple[str, tuple[str, ...]]:
+        """
+        docstring first line and supported phases of a script, parsed again only if the file changed
+        phases are the ones declared with CDI_PHASES, else the parent folder if it is named after a phase
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return '', ()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._infos.get(path)
+        if cached is None or cached[0] != stamp:
+            doc, phases = read_script_info(path)
+            if not phases and path.parent.name in ScriptType.__members__:
+                phases = (path.parent.name,)
+            cached = self._infos[path] = (stamp, doc, phases)
+        return cached[1], cached[2]
+
+    def scripts(self, phase: str = '') -> list[tuple[str, Path, str]]:
+        """
+        cached until the index is rebuilt or a script is forgotten
+        :param phase: only the scripts supporting this phase, scripts that declare no phase support all of them
+        :return: [(name, path, docstring first line)] of the python scripts
+        """
+        self.refresh()
+        cached = self._listings.get(phase)
+        if cached is not None and cached[0] == self.generation:
+            return cached[1]
+
+        result = []
+        for name, path in self.files.items():
+            if not name.endswith('.py'): continue
+            doc, phases = self.info(path)
+            if phase and phases and phase not in phases: continue
+            result.append((name, path, doc))
+        self._listings[phase] = (self.generation, result)
+        return result
+
+    def forget(self, path):
+        """a script changed on disk, read its info again"""
+        self._infos.pop(Path(path), None)
+        self._listings.clear()
+
+
+G_script_index = ScriptIndex(get_ScriptDir())
+
+
 def get_ScriptFile(filename) -> Union[Path, None]:
-    # walk through all files in the script directory
-    for root, dirs, files in os.walk(get_ScriptDir()):
-        for file in files:
-            if file == filename:
-                return Path(root).joinpath(file)
-    return None
+    return G_script_index.get(filename)
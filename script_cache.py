@@ -0,0 +1,61 @@
+import os
+from types import CodeType
+
+
+class ScriptCodeCache():
+    """
+    Compiled hook scripts, keyed by resolved path.
+    The mtime/size of the scripts is checked once per drop with validate, a get is then a dict lookup.
+    """
+
+    def __init__(self):
+        self._codes: dict[str, tuple[tuple[int, int], CodeType]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path) -> CodeType:
+        """
+        get the compiled code of a script, compiled on first use or after validate found it changed
+        :param path: script file path
+        :return: code object that can be passed to exec
+        :raise FileNotFoundError: if the script does not exist
+        """
+        key = os.path.abspath(path)
+        cached = self._codes.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        st = os.stat(key)
+        with open(key, 'rb') as f:
+            code = compile(f.read(), key, 'exec')
+        self._codes[key] = ((st.st_mtime_ns, st.st_size), code)
+        return code
+
+    def validate(self, paths):
+        """drop the cached scripts changed or removed on disk, once per drop"""
+        for path in paths:
+            key = os.path.abspath(path)
+            cached = self._codes.get(key)
+            if cached is None: continue
+            try:
+                st = os.stat(key)
+            except OSError:
+                self._codes.pop(key)
+                continue
+            if cached[0] != (st.st_mtime_ns, st.st_size):
+                self._codes.pop(key)
+
+    def invalidate(self, path=None):
+        """drop one script or the whole cache"""
+        if path is None:
+            self._codes.clear()
+        else:
+            self._codes.pop(os.path.abspath(path), None)
+
+    def stats(self) -> dict[str, int]:
+        return {'size': len(self._codes), 'hits': self.hits, 'misses': self.misses}
+
+
+G_script_cache = ScriptCodeCache()
@@ -21,4 +21,33 @@ data = {
     'Clipboard is empty!': '剪贴板为空！',
     'Clipboard import keymap': '剪贴板导入快捷键',
     'Ctrl Alt LeftMouse Drag': 'Ctrl Alt 左键拖动',
+    '(Duplicate name)': '(重名)',
+    'Batch Import': '批量导入',
+    'Parallel Import': '并行导入',
+    'Parallel Import Workers': '并行导入进程数',
+    'Timeout Per File': '单文件超时',
+    'Last Import': '最近导入',
+    'Record Imports': '记录导入',
+    'No import recorded': '没有导入记录',
+    'Dump Import Reports': '导出导入报告',
+    'Reuse Imported': '复用已导入',
+    'No Undo': '不记录撤销',
+    'Lazy Register': '延迟注册',
+    'Queued Import': '排队导入',
+    'Import in the background a few files at a time, with a progress bar and Esc to cancel': '在后台每次导入少量文件，显示进度条，按 Esc 取消',
+    'Reload On Change': '文件变化时重新加载',
+    'Watch the config and script folders, reload changed files automatically': '监视配置和脚本文件夹，自动重新加载变化的文件',
+    'Register import operators on first drop instead of at startup': '首次拖入时注册导入操作符，而不是在启动时',
+    'Edit Selected': '编辑所选',
+    'Select All': '全选',
+    'Deselect All': '取消全选',
+    'Set Area': '设置区域',
+    'Set Context': '设置上下文',
+    'Add File Extension': '添加文件扩展名',
+    'Remove File Extension': '移除文件扩展名',
+    'Add Script': '添加脚本',
+    'Move To Category': '移动到分类',
+    'Phase': '阶段',
+    'No config selected': '未选择配置',
+    'Select for editing several configs at once': '选中以同时编辑多个配置',
 }
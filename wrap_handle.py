@@ -2,12 +2,288 @@ import bpy
 import os
 from pathlib import Path
 from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Callable
 
-from .public_path import get_ScriptFile
+from .public_path import get_ScriptFile, G_script_index
+from .script_cache import G_script_cache
+from .ext_matcher import ExtensionMatcher
+from .parallel_import import ParallelImporter, is_headless_safe
+from .import_report import new_recorder
+from .import_tracker import ImportTracker
+from .import_dedup import G_import_dedup
 
 
-def empty_op(operator_context: str, filepath, kwargs=None):
-    print('Invalid/Empty Operator: ', operator_context, filepath, kwargs)
+# python types accepted by each rna property type, used to check kwargs before import
+C_RNA_PY_TYPES = {
+    'BOOLEAN': bool,
+    'INT': int,
+    'FLOAT': (int, float),
+    'STRING': str,
+    'ENUM': (str, set),
+}
+
+
+def empty_op(operator_context: str, **kwargs):
+    print('Invalid/Empty Operator: ', operator_context, kwargs)
+
+
+def resolve_operator(bl_import_operator: str) -> tuple[object | None, dict[str, str], str]:
+    """
+    find the operator callable and its rna properties
+    :return: (callable, {identifier: rna type}, error message)
+    """
+    if bl_import_operator == '':
+        return empty_op, {}, ''  # user can empty the operator, then only scripts run
+    try:
+        cat, name = bl_import_operator.split('.')
+        op = getattr(getattr(bpy.ops, cat), name)
+        props = {prop.identifier: prop.type for prop in op.get_rna_type().properties}
+    except (ValueError, AttributeError, KeyError, RuntimeError):
+        return None, {}, 'Invalid Operator: ' + bl_import_operator
+    return op, props, ''
+
+
+def check_import_operator(bl_import_operator: str, use_batch_import: bool = False,
+                          kwargs: dict = None) -> tuple[object | None, dict[str, str], bool, str]:
+    """
+    resolve and validate the import operator of a config, without its generated operator class
+    :return: (callable, {identifier: rna type}, batch import, error message)
+    """
+    op_callable, props, error = resolve_operator(bl_import_operator)
+    batch_import = use_batch_import and {'directory', 'files'}.issubset(props)
+    if not error and op_callable is not empty_op:
+        if 'filepath' not in props and not batch_import:
+            error = 'Operator has no filepath property: ' + bl_import_operator
+        elif kwargs:
+            error = check_kwargs(kwargs, props)
+    return op_callable, props, batch_import, error
+
+
+def check_kwargs(kwargs: dict, props: dict[str, str]) -> str:
+    """:return: error message, empty if all kwargs match the operator properties"""
+    for key, value in kwargs.items():
+        if key not in props:
+            return f'Unknown operator property: {key}'
+        py_type = C_RNA_PY_TYPES.get(props[key])
+        if py_type and not isinstance(value, py_type):
+            return f'Operator property {key} expects {props[key].lower()}'
+    return ''
+
+
+@contextmanager
+def suspend_global_undo(context):
+    """disable global undo while importing, for pipeline imports that do not need to be undone"""
+    edit = context.preferences.edit
+    use_global_undo = edit.use_global_undo
+    is_dirty = context.preferences.is_dirty
+    edit.use_global_undo = False
+    try:
+        yield
+    finally:
+        edit.use_global_undo = use_global_undo
+        context.preferences.is_dirty = is_dirty
+
+
+# event attributes kept for the scripts of a queued drop, the event itself is freed after invoke
+C_EVENT_ATTRS = ('type', 'value', 'alt', 'ctrl', 'shift', 'oskey',
+                 'mouse_x', 'mouse_y', 'mouse_region_x', 'mouse_region_y')
+
+
+def copy_event(event) -> SimpleNamespace | None:
+    if event is None: return None
+    return SimpleNamespace(**{attr: getattr(event, attr) for attr in C_EVENT_ATTRS})
+
+
+class ImportJob():
+    """
+    One drop: the file names and the import operator class (config) to import them with.
+    Run at once by the operator, or one file per step from the import queue.
+    Only plain python values are kept, the operator instance is freed when a queued drop returns.
+    """
+
+    def __init__(self, op: type, directory: str, files: list[str], event=None, report: Callable = None):
+        self.op = op
+        self.directory = directory
+        self.files = files
+        self.event = event
+        self.report = report or (lambda type, message: print('CDI:', message))
+        self.done = 0
+        self.total = len(files)  # files matching the extensions once started
+        self.cancelled = False
+        self._recorder = None
+
+    def cancel(self):
+        """stop before the next file, the files imported so far are kept and the post script still runs"""
+        self.cancelled = True
+
+    def run(self, context):
+        for _ in self.steps(context):
+            pass
+
+    def steps(self, context):
+        """import the files, yield before each file imported in process"""
+        op = self.op
+        files = self.files
+        self._recorder = rec = new_recorder(op.bl_label, op.bl_import_operator)
+        self._validate_scripts()
+        with self._process_scripts(op.pre_script, op.post_script,
+                                   {'directory': self.directory, 'files': files, 'event': self.event}):
+            tracker = ImportTracker(context)
+
+            matched = [(index, file) for index, file in enumerate(files) if op.ext_matcher.match(file)]
+            self.total = len(matched)
+            if op.op_error:
+                op.resolve()  # the operator may come from an addon registered after this one
+            if op.op_error:
+                self.report({'WARNING'}, op.op_error)
+                op_callable = empty_op
+            else:
+                op_callable = op.op_callable
+
+            if op.batch_import and matched and op_callable is not empty_op:
+                self._import_batch(op_callable, matched, files, tracker)
+                matched = []
+            elif op.parallel_import and len(matched) > 1 and op_callable is not empty_op:
+                with rec.phase('parallel_import'):
+                    matched = self._import_parallel(context, matched, files, tracker)
+            self.done = self.total - len(matched)
+
+            for index, file in matched:
+                yield
+                if self.cancelled:
+                    self.report({'WARNING'}, f'Import cancelled, {self.total - self.done} files skipped')
+                    break
+                filepath = os.path.join(self.directory, file)
+                rec.begin_file(filepath)
+
+                kwargs = self._foreach_kwargs(filepath, index, files, tracker)
+                with self._process_scripts(op.foreach_pre_script, op.foreach_post_script, kwargs, foreach=True):
+                    digest = G_import_dedup.file_hash(filepath) if op.dedup_import else None
+                    key = G_import_dedup.import_key(op, digest) if digest else None
+                    if key and G_import_dedup.instance(context, key) is not None:
+                        kwargs.update(tracker.diff())
+                        self.report({'INFO'}, 'Instanced: ' + file)
+                    else:
+                        with rec.phase('import'):
+                            if op.kwargs:
+                                op_callable(op.operator_context, filepath=filepath, **op.kwargs)
+                            else:
+                                op_callable(op.operator_context, filepath=filepath)
+                        # pass the new data to foreach post script
+                        kwargs.update(tracker.diff())
+                        if key:
+                            G_import_dedup.remember(key, kwargs['new_objects'])
+
+                        self.report({'INFO'}, 'Imported: ' + file)
+
+                rec.end_file()
+                self.done += 1
+            # just make it behavior like blender's default drag
+            with rec.phase('restore_selection'):
+                tracker.restore_selection(context)
+
+        rec.finish()
+
+    def _import_batch(self, op_callable, matched: list[tuple[int, str]], files: list[str],
+                      tracker: ImportTracker):
+        """import all matched files with a single operator call, foreach scripts run around it per file"""
+        op = self.op
+        filepaths = [(index, os.path.join(self.directory, file)) for index, file in matched]
+
+        rec = self._recorder
+        if op.foreach_pre_script is not None:
+            with rec.phase('foreach_pre_script'):
+                for index, filepath in filepaths:
+                    self._exec_script(op.foreach_pre_script,
+                                      self._foreach_kwargs(filepath, index, files, tracker))
+
+        rec.begin_file(self.directory)
+        kwargs = dict(op.kwargs) if op.kwargs else {}
+        if 'filepath' in op.op_props:
+            kwargs.setdefault('filepath', filepaths[0][1])
+        with rec.phase('import'):
+            op_callable(op.operator_context,
+                        directory=self.directory,
+                        files=[{'name': file} for _, file in matched],
+                        **kwargs)
+        self.report({'INFO'}, f'Imported: {len(matched)} files')
+
+        new_data = tracker.diff()  # can not tell which file created which data in one call
+        rec.end_file()
+
+        if op.foreach_post_script is not None:
+            with rec.phase('foreach_post_script'):
+                for index, filepath in filepaths:
+                    self._exec_script(op.foreach_post_script,
+                                      {**self._foreach_kwargs(filepath, index, files, tracker), **new_data})
+
+    def _import_parallel(self, context, matched: list[tuple[int, str]], files: list[str],
+                         tracker: ImportTracker) -> list[tuple[int, str]]:
+        """import files in background processes
+        :return: files left to import in process
+        """
+        from .display import get_pref
+        pref = get_pref()
+        op = self.op
+
+        with ParallelImporter(op.bl_import_operator, self.directory, files, kwargs=op.kwargs,
+                              foreach_pre_script=op.foreach_pre_script,
+                              foreach_post_script=op.foreach_post_script,
+                              workers=pref.parallel_workers, timeout=pref.parallel_timeout) as importer:
+            fallback = set(importer.run(matched))
+            for index, file in matched:
+                if index in fallback: continue
+                importer.append(context, index)
+                tracker.diff()
+                self.report({'INFO'}, 'Imported: ' + file)
+
+        if fallback:
+            self.report({'WARNING'}, f'Import {len(fallback)} files in process')
+        return [(index, file) for index, file in matched if index in fallback]
+
+    def _foreach_kwargs(self, filepath: str, index: int, files: list[str], tracker: ImportTracker) -> dict:
+        return {'filepath': filepath, 'index': index, 'event': self.event,
+                'directory': self.directory, 'files': files,
+                # imported of previous files, per file
+                'selected_objects': tracker.new_objects,
+                'selected_nodes': tracker.new_nodes,
+                # imported of this file, filled in before foreach post script
+                'new_objects': [],
+                'new_datablocks': {},
+                'new_nodes': [],
+                }
+
+    @contextmanager
+    def _process_scripts(self, pre: str | None, post: str | None, kwargs: dict, foreach: bool = False):
+        prefix = 'foreach_' if foreach else ''
+        if pre is not None:
+            with self._recorder.phase(prefix + 'pre_script'):
+                self._exec_script(pre, kwargs)
+        yield
+        if post is not None:
+            with self._recorder.phase(prefix + 'post_script'):
+                self._exec_script(post, kwargs)
+
+    def _validate_scripts(self):
+        """check the script folder and the scripts of the config once, each script call is then a dict lookup"""
+        op = self.op
+        G_script_index.validate()
+        names = [s for script in (op.pre_script, op.post_script, op.foreach_pre_script, op.foreach_post_script)
+                 if script for s in script.split(';')]
+        G_script_cache.validate(file for file in map(get_ScriptFile, names) if file)
+
+    def _exec_script(self, script: str, kwargs: dict):
+        scripts = script.split(';')
+        for s in scripts:
+            file = get_ScriptFile(s)
+            if not file: return
+            try:
+                code = G_script_cache.get(file)
+            except FileNotFoundError:
+                return
+            # pass in kwargs
+            exec(code, {**kwargs})
 
 
 class DynamicImport():
@@ -17,14 +293,40 @@ class DynamicImport():
     clipboard_files: bpy.props.StringProperty(options={'SKIP_SAVE'})  # file names join with ;
     # pass in
     bl_file_extensions: str
+    ext_matcher: ExtensionMatcher  # compiled from bl_file_extensions
     bl_import_operator: str
     operator_context: str
+    use_batch_import: bool  # from config
+    batch_import: bool  # pass all files in one call, only set if the operator accepts directory/files
+    parallel_import: bool  # import in background blender processes, only set if the operator is headless safe
+    dedup_import: bool  # instance objects of a file content imported before in this session
+    no_undo: bool  # no undo step for the whole drop
+    queued_import: bool  # import from the queue a few files per tick, instead of blocking until done
+    event = None  # set in invoke
     # custom
     kwargs: dict
     pre_script: str
     post_script: str
     foreach_pre_script: str
     foreach_post_script: str
+    # resolved at registration
+    op_callable: object
+    op_props: dict[str, str]
+    op_error: str
+
+    @classmethod
+    def resolve(cls) -> str:
+        """
+        resolve and validate the import operator, cache the result on the class
+        :return: error message, empty if valid
+        """
+        op_callable, props, cls.batch_import, error = check_import_operator(
+            cls.bl_import_operator, cls.use_batch_import, cls.kwargs)
+
+        cls.op_callable = staticmethod(op_callable or empty_op)
+        cls.op_props = props
+        cls.op_error = error
+        return error
 
     def execute(self, context):
         if not self.directory:
@@ -34,56 +336,17 @@ class DynamicImport():
         else:
             files = [file.name for file in self.files]
 
-        with self._process_scripts(self.pre_script, self.post_script,
-                                   {'directory': self.directory, 'files': files, 'event': self.event}):
-            select_objs = []
-            select_nodes = []
-
-            for index, file in enumerate(files):
-                has_ext = self._check_extension(file, self.bl_file_extensions)
-                if not has_ext: continue
-
-                filepath = os.path.join(self.directory, file)
-                try:
-                    cat, name = self.bl_import_operator.split('.')
-                    op_callable = getattr(getattr(bpy.ops, cat), name)
-                except (ValueError, AttributeError):  # user can empty the operator
-                    self.report({'WARNING'}, 'Invalid/Empty Operator: ' + self.bl_import_operator)
-                    op_callable = empty_op
-
-                with self._process_scripts(self.foreach_pre_script, self.foreach_post_script,
-                                           {'filepath': filepath, 'index': index, 'event': self.event,
-                                            'directory': self.directory, 'files': files,
-                                            'selected_objects': select_objs,
-                                            'selected_nodes': select_nodes
-                                            }):
-                    if self.kwargs:
-                        op_callable(self.operator_context, filepath=filepath, **self.kwargs)
-                    else:
-                        op_callable(self.operator_context, filepath=filepath)
-
-                    self.report({'INFO'}, 'Imported: ' + file)
-
-                # restore select
-                if hasattr(context, 'selected_objects'):
-                    select_objs.append(list(context.selected_objects))
-                if hasattr(context, 'selected_nodes'):
-                    select_nodes.append(list(context.selected_nodes))
-            # just make it behavior like blender's default drag
-            for obj_list in select_objs:
-                for obj in obj_list:
-                    obj.select_set(True)
-            if hasattr(context, 'selected_nodes'):
-                tree = context.space_data.node_tree
-                for node_list in select_nodes:
-                    for node in node_list:
-                        node.select = True
-                if select_nodes:
-                    try:
-                        tree.nodes.active = select_nodes[0][0]
-                    except Exception as e:
-                        print(e)
+        if self.queued_import:
+            from .import_queue import enqueue
+            enqueue(ImportJob(type(self), self.directory, files, event=copy_event(self.event)))
+            return {'FINISHED'}
 
+        job = ImportJob(type(self), self.directory, files, event=self.event, report=self.report)
+        if not self.no_undo:
+            job.run(context)
+        else:
+            with suspend_global_undo(context):
+                job.run(context)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -93,36 +356,15 @@ class DynamicImport():
         context.window_manager.fileselect_add(self)
         return {'RUNNING_MODAL'}
 
-    @contextmanager
-    def _process_scripts(self, pre: str | None, post: str | None, kwargs: dict):
-        if pre is not None:
-            self._exec_script(pre, kwargs)
-        yield
-        if post is not None:
-            self._exec_script(post, kwargs)
-
-    def _exec_script(self, script: str, kwargs: dict):
-        scripts = script.split(';')
-        for s in scripts:
-            file = get_ScriptFile(s)
-            if not file or not file.exists(): return
-            with open(file, 'r', encoding='utf-8') as f:
-                data = f.read()
-                # pass in kwargs
-                exec(data, {**kwargs})
-
-    def _check_extension(self, filename, ext_str: str) -> bool:
-        if ';' not in ext_str:
-            return filename.endswith(ext_str)
-        else:
-            exts = ext_str.split(';')
-            for ext in exts:
-                if filename.endswith(ext): return True
-            return False
-
 
 def gen_import_op(bl_idname, bl_label, bl_import_operator: str, bl_file_extensions,
                   operator_context: str = 'INVOKE_DEFAULT',
+                  batch_import: bool = False,
+                  parallel_import: bool = False,
+                  dedup_import: bool = False,
+                  no_undo: bool = False,
+                  queued_import: bool = False,
+                  poll_area: str = 'ALL',
                   kwargs: dict = None,
                   pre_script: str = None,
                   post_script: str = None,
@@ -133,9 +375,18 @@ def gen_import_op(bl_idname, bl_label, bl_import_operator: str, bl_file_extensio
               {
                   "bl_idname": bl_idname,
                   "bl_label": bl_label,
+                  # the whole drop is one undo step, nested import operators do not push their own.
+                  # a queued drop is imported later, the import queue pushes the undo step
+                  "bl_options": set() if no_undo or queued_import else {'UNDO'},
                   "bl_import_operator": bl_import_operator,
                   "bl_file_extensions": bl_file_extensions,
+                  "ext_matcher": ExtensionMatcher(bl_file_extensions),
                   "operator_context": operator_context,
+                  "use_batch_import": batch_import,
+                  "parallel_import": parallel_import and is_headless_safe(bl_import_operator, poll_area),
+                  "dedup_import": dedup_import,
+                  "no_undo": no_undo,
+                  "queued_import": queued_import,
                   # custom
                   "kwargs": kwargs,
                   "invoke": DynamicImport.invoke,
@@ -146,6 +397,7 @@ def gen_import_op(bl_idname, bl_label, bl_import_operator: str, bl_file_extensio
                   "foreach_post_script": foreach_post_script
               }
               )
+    op.resolve()
 
     return op
 
@@ -172,9 +424,25 @@ class DropPoll:
     def poll_TEXT_EDITOR(cls, context):
         return context.area and context.area.type == 'TEXT_EDITOR'
 
+    @staticmethod
+    def with_materialize(poll, materialize: Callable[[], bool]):
+        """poll the area, then accept the drop only once the import operator is registered"""
+
+        def poll_drop(cls, context):
+            return poll(context) and materialize()
+
+        return classmethod(poll_drop)
+
 
 def gen_import_handle(bl_idname: str, bl_label: str, bl_import_operator: str, bl_file_extensions: str,
-                      poll_area: str):
+                      poll_area: str, materialize: Callable[[], bool] = None):
+    """
+    :param materialize: called on drop poll of a lazy config, True if the import operator is registered,
+    else it requests the registration
+    """
+    poll = getattr(DropPoll, f'poll_{poll_area}', DropPoll.poll_ALL)
+    if materialize is not None:
+        poll = DropPoll.with_materialize(poll, materialize)
     ars = {
         "bl_idname": bl_idname,
         "bl_label": bl_label,
@@ -182,12 +450,13 @@ def gen_import_handle(bl_idname: str, bl_label: str, bl_import_operator: str, bl
         "bl_file_extensions": bl_file_extensions,
         # custom
         "poll_area": poll_area,
+        "ext_matcher": ExtensionMatcher(bl_file_extensions),
     }
 
     handle = type(bl_idname,
                   (bpy.types.FileHandler,), {
                       **ars,
-                      "poll_drop": getattr(DropPoll, f'poll_{poll_area}', DropPoll.poll_ALL)
+                      "poll_drop": poll
                   }
                   )
 